@@ -1,15 +1,26 @@
 # app/animation_controller.py
 from __future__ import annotations
 
-import json
+import logging
+import struct
 import threading
 import time
-from typing import Callable, List, Set, Tuple, Optional
+from typing import Callable, Set, Tuple, Optional
+
+import numpy as np
 
 from app.led_controller import LEDThread
 
 Color = Tuple[int, int, int]
 
+# Channel order expected by the Teensy (GRB), as a gather over RGB
+_GRB_PERM = np.array([1, 0, 2], dtype=np.intp)
+
+# Unchanged frames are re-sent to the LEDs at most this often (seconds)
+_RESEND_S = 1.0
+# Longest the run loop sleeps in idle mode before re-checking stop_evt
+_IDLE_WAIT_S = 0.5
+
 
 class AnimationControllerThread(threading.Thread):
     """Thread driving frames to LEDs and (optionally) web clients.
@@ -21,6 +32,9 @@ class AnimationControllerThread(threading.Thread):
     draw:    External callers update pixels via update_pixel(...).
     """
 
+    # Colors stepped through by the "test" mode, one per second
+    TEST_COLORS: Tuple[Color, ...] = ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+
     def __init__(
         self,
         stop_evt: threading.Event,
@@ -38,61 +52,113 @@ class AnimationControllerThread(threading.Thread):
 
         self.mode = "idle"          # "idle" | "test" | "draw"
         self.send_to_led = True      # can be toggled if you want preview-only
-        self.send_to_web = True      # not used by the new web_server (it polls)
+        self.send_to_web = True      # legacy push only; web_server listens for changes
 
-        # Framebuffer: row-major [y][x] as RGB tuples
-        self._frame: List[List[Color]] = [
-            [(0, 0, 0) for _ in range(width)] for _ in range(height)
-        ]
+        # Framebuffer: row-major [y, x] RGB, one contiguous uint8 array
+        self._frame: np.ndarray = np.zeros((height, width, 3), dtype=np.uint8)
         self._frame_lock = threading.Lock()
+        # Back buffer: readers copy the frame here under the lock and serialize
+        # from it afterwards, so writers never wait on encoding work
+        self._back: np.ndarray = np.empty_like(self._frame)
+        # Reused GRB output buffer so pushing a frame does not allocate
+        self._grb_scratch: np.ndarray = np.empty((height, width, 3), dtype=np.uint8)
 
-        # Optional: legacy push to self-registered web clients (JSON)
-        self._web_clients: Set[Callable[[str], None]] = set()
+        # Optional: legacy push to self-registered web clients (binary RGB)
+        self._web_clients: Set[Callable[[bytes], None]] = set()
+        # Called (outside the lock) whenever the framebuffer changes, so the
+        # web preview can wake on new frames instead of polling on a timer
+        self._frame_listeners: list[Callable[[], None]] = []
 
-        # A "dirty" event to allow immediate flushes (from WS)
-        self._dirty_evt = threading.Event()
+        # "Dirty" flag guarded by the frame lock; the condition lets writers
+        # wake the run loop for an immediate flush (from WS) without a
+        # second lock round-trip per pixel
+        self._dirty = False
+        self._dirty_cv = threading.Condition(self._frame_lock)
+
+        # Skip redundant work: last test-pattern step drawn, and the last GRB
+        # payload sent (re-sent at most every _RESEND_S while unchanged)
+        self._last_test_idx = -1
+        self._last_sent: Optional[bytes] = None
+        self._last_sent_ts = 0.0
 
     # ------------------------------------------------------------------
     # Public API used by web_server.py
     def set_mode(self, mode: str) -> None:
         """Set operating mode: 'idle', 'test', or 'draw'."""
         if mode in {"idle", "test", "draw"}:
-            self.mode = mode
+            with self._dirty_cv:
+                self.mode = mode
+                self._last_test_idx = -1
+                # Wake the run loop so the new mode takes effect immediately
+                self._dirty_cv.notify()
             if mode == "idle":
                 self.clear_panel()
                 self.flush()
 
-    def register_client(self, sender: Callable[[str], None]) -> None:
-        """Legacy JSON push registration (web_server now polls)."""
+    def register_client(self, sender: Callable[[bytes], None]) -> None:
+        """Legacy binary push registration (web_server uses frame listeners)."""
         self._web_clients.add(sender)
 
-    def unregister_client(self, sender: Callable[[str], None]) -> None:
+    def unregister_client(self, sender: Callable[[bytes], None]) -> None:
         self._web_clients.discard(sender)
 
+    def add_frame_listener(self, cb: Callable[[], None]) -> None:
+        """Call ``cb()`` after every framebuffer change; it must be cheap and thread-safe."""
+        self._frame_listeners.append(cb)
+
+    def remove_frame_listener(self, cb: Callable[[], None]) -> None:
+        if cb in self._frame_listeners:
+            self._frame_listeners.remove(cb)
+
+    def _frame_changed(self) -> None:
+        for cb in self._frame_listeners:
+            cb()
+
     def update_pixel(self, x: int, y: int, color: Color) -> None:
         """Update a single pixel in the framebuffer."""
         if 0 <= x < self.width and 0 <= y < self.height:
             with self._frame_lock:
-                self._frame[y][x] = (
+                self._frame[y, x] = (
                     int(color[0]) & 0xFF,
                     int(color[1]) & 0xFF,
                     int(color[2]) & 0xFF,
                 )
-        # mark dirty so the run loop can push sooner
-        self._dirty_evt.set()
+                # mark dirty so the run loop can push sooner
+                self._dirty = True
+                self._dirty_cv.notify()
+            self._frame_changed()
+
+    def update_pixels(self, xs: np.ndarray, ys: np.ndarray, colors: np.ndarray) -> None:
+        """Bulk :meth:`update_pixel`: write many pixels under one lock.
+
+        ``colors`` is an ``(N, 3)`` array; out-of-range coordinates are
+        skipped and channels are masked to 8 bits like the single-pixel path.
+        """
+        xs = np.asarray(xs, dtype=np.intp)
+        ys = np.asarray(ys, dtype=np.intp)
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if not keep.any():
+            return
+        rgb = (np.asarray(colors, dtype=np.int64)[keep] & 0xFF).astype(np.uint8)
+        with self._frame_lock:
+            self._frame[ys[keep], xs[keep]] = rgb
+            self._dirty = True
+            self._dirty_cv.notify()
+        self._frame_changed()
 
     def clear_panel(self) -> None:
         """Set all pixels to black and flush."""
-        with self._frame_lock:
-            for y in range(self.height):
-                row = self._frame[y]
-                for x in range(self.width):
-                    row[x] = (0, 0, 0)
-        self._dirty_evt.set()
+        with self._dirty_cv:
+            self._frame.fill(0)
+            self._dirty = True
+            self._dirty_cv.notify()
+        self._frame_changed()
 
     def flush(self) -> None:
         """Request that the current framebuffer be pushed ASAP."""
-        self._dirty_evt.set()
+        with self._dirty_cv:
+            self._dirty = True
+            self._dirty_cv.notify()
 
     def framebuffer_rgb_bytes(self) -> tuple[bytes, int, int]:
         """Return (RGB bytes, width, height) for preview/broadcast.
@@ -101,38 +167,39 @@ class AnimationControllerThread(threading.Thread):
         Teensy output uses GRB (handled internally).
         """
         with self._frame_lock:
-            out = bytearray(self.width * self.height * 3)
-            i = 0
-            for y in range(self.height):
-                for x in range(self.width):
-                    r, g, b = self._frame[y][x]
-                    out[i] = r & 0xFF
-                    out[i + 1] = g & 0xFF
-                    out[i + 2] = b & 0xFF
-                    i += 3
-            return bytes(out), self.width, self.height
-
-    def _frame_bytes_grb(self) -> bytes:
-        """Build GRB bytes for Teensy."""
+            return self._frame.tobytes(), self.width, self.height
+
+    def _snapshot(self) -> np.ndarray:
+        """Copy the framebuffer into the back buffer and return it.
+
+        The lock is held only for the copy; callers serialize the returned
+        array without blocking ``update_pixel``. Only the run loop thread may
+        use the back buffer.
+        """
         with self._frame_lock:
-            data = bytearray(self.width * self.height * 3)
-            i = 0
-            for y in range(self.height):
-                for x in range(self.width):
-                    r, g, b = self._frame[y][x]
-                    # Teensy expects GRB
-                    data[i] = g & 0xFF
-                    data[i + 1] = r & 0xFF
-                    data[i + 2] = b & 0xFF
-                    i += 3
-            return bytes(data)
-
-    def _broadcast_legacy_json(self) -> None:
-        """Legacy push of the whole frame as JSON; optional."""
+            np.copyto(self._back, self._frame)
+        return self._back
+
+    def _frame_bytes_grb(self) -> memoryview:
+        """Build GRB bytes for Teensy.
+
+        Returns a view into a scratch buffer that is overwritten by the next
+        call, so consumers must send (or copy) it before building another.
+        """
+        frame = self._snapshot()
+        # Teensy expects GRB; mode="clip" lets take() write straight into out
+        np.take(frame, _GRB_PERM, axis=2, out=self._grb_scratch, mode="clip")
+        return memoryview(self._grb_scratch).cast("B")
+
+    def _broadcast_binary(self) -> None:
+        """Legacy push of the whole frame; optional.
+
+        Payload is ``<HH`` (width, height, little-endian) followed by the raw
+        row-major RGB bytes, sent as a websocket binary message.
+        """
         if not self.send_to_web or not self._web_clients:
             return
-        with self._frame_lock:
-            payload = json.dumps({"frame": self._frame})
+        payload = struct.pack("<HH", self.width, self.height) + self._snapshot().tobytes()
         for sender in list(self._web_clients):
             try:
                 sender(payload)
@@ -141,44 +208,60 @@ class AnimationControllerThread(threading.Thread):
 
     def _test_pattern(self, t: float) -> None:
         """Very small demo animation cycling primary colors."""
-        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
-        col = colors[int(t) % 3]
+        colors = self.TEST_COLORS
+        idx = int(t) % len(colors)
+        if idx == self._last_test_idx:
+            return
+        self._last_test_idx = idx
         with self._frame_lock:
-            for y in range(self.height):
-                row = self._frame[y]
-                for x in range(self.width):
-                    row[x] = col
+            self._frame[:] = colors[idx]
+        self._frame_changed()
 
     # ------------------------------------------------------------------
     def run(self) -> None:  # pragma: no cover - contains time loop
-        print("[Anim] controller starting")
+        logging.info("[Anim] controller starting")
         frame_period = 1.0 / self.fps
-        next_tick = time.time()
+        next_tick = time.monotonic()
 
         while not self.stop_evt.is_set():
-            now = time.time()
+            now = time.monotonic()
 
             # Update animation if requested
             if self.mode == "test":
                 self._test_pattern(now)
 
+            with self._dirty_cv:
+                dirty = self._dirty
+                self._dirty = False
+
             # Push to LEDs if allowed or if explicitly flushed
-            push_due = now >= next_tick or self._dirty_evt.is_set()
-            if self.send_to_led and push_due:
-                if self.mode != "idle" or self._dirty_evt.is_set():
+            push_due = now >= next_tick or dirty
+            if push_due:
+                if self.send_to_led and (self.mode != "idle" or dirty):
                     try:
                         payload = self._frame_bytes_grb()
-                        self.led_thread.send_raw_frame(payload)
+                        # Don't stream identical frames over the UART; still
+                        # refresh occasionally in case an earlier send was lost
+                        if payload != self._last_sent or now - self._last_sent_ts >= _RESEND_S:
+                            self.led_thread.send_raw_frame(payload)
+                            self._last_sent = payload.tobytes()
+                            self._last_sent_ts = now
                     except Exception:
                         pass  # keep running if led thread hiccups
-                self._dirty_evt.clear()
+                # Advance even in preview-only mode, or the wait below never blocks
                 next_tick = now + frame_period
 
-            # Optional legacy web push (the new web_server polls instead)
-            # self._broadcast_legacy_json()
+            # Optional legacy web push (web_server uses frame listeners instead)
+            # self._broadcast_binary()
 
-            # Small sleep to avoid busy loop; wake early on flush
-            self._dirty_evt.wait(timeout=0.01)
-            self._dirty_evt.clear()
+            # Sleep until the next tick (or, when idle, until a mode change or
+            # flush wakes us); the idle timeout only bounds stop latency
+            with self._dirty_cv:
+                if not self._dirty:
+                    if self.mode == "idle":
+                        timeout = _IDLE_WAIT_S
+                    else:
+                        timeout = max(0.0, next_tick - time.monotonic())
+                    self._dirty_cv.wait(timeout=timeout)
 
-        print("[Anim] controller stopped")
+        logging.info("[Anim] controller stopped")
@@ -19,10 +19,14 @@
 #   - driver/LCD_2inch.py (Waveshare)
 #   - gpiozero + lgpio backend (GPIOZERO_PIN_FACTORY=lgpio)
 
+import os
 import time
 import threading
 import logging
-from typing import Dict, Any, Callable
+from functools import partial
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import numpy as np
 from PIL import Image
 import PIL.Image as PILImage
 from driver import LCD_2inch
@@ -32,16 +36,17 @@ from app.ui_render import render_menu
 
 # Button pins (BCM numbering)
 BTN_PINS = {"UP": 17, "DOWN": 22, "SELECT": 23, "BACK": 24}
-DEBOUNCE_S = 0.05
+DEBOUNCE_S = 0.02  # seconds
 RENDER_INTERVAL = 0.15  # seconds
+# Without input, wake this often to pick up clock / Wi-Fi / sleep-timer changes
+IDLE_REFRESH_S = 1.0
 
-def _orient(img: PILImage.Image, rotation: int) -> PILImage.Image:
-    """Rotate image clockwise by rotation (0/90/180/270)."""
-    if rotation == 0:   return img
-    if rotation == 90:  return img.transpose(PILImage.Transpose.ROTATE_270)  # CW
-    if rotation == 180: return img.transpose(PILImage.Transpose.ROTATE_180)
-    if rotation == 270: return img.transpose(PILImage.Transpose.ROTATE_90)   # CW
-    return img
+def _transpose_op(rotation: int):
+    """PIL transpose op rotating clockwise by rotation, or None for 0/unknown."""
+    if rotation == 90:  return PILImage.Transpose.ROTATE_270  # CW
+    if rotation == 180: return PILImage.Transpose.ROTATE_180
+    if rotation == 270: return PILImage.Transpose.ROTATE_90   # CW
+    return None
 
 
 class DisplayThread(threading.Thread):
@@ -69,6 +74,8 @@ class DisplayThread(threading.Thread):
         self.assets_dir = assets_dir
 
         self._rot = int(rotation) % 360
+        # Resolved once; rotation is fixed for the lifetime of the thread
+        self._transpose_op = _transpose_op(self._rot)
 
         # Init display
         self.disp = LCD_2inch.LCD_2inch()
@@ -85,12 +92,86 @@ class DisplayThread(threading.Thread):
 
         self.canvas = Image.new("RGB", (self.W, self.H), "black")
         self._last_render = 0.0
+        # Last backlight level written to the driver (None = unknown)
+        self._last_brightness: Optional[int] = None
+        # Static screensaver frame, built on first use; flag set once it is on screen
+        self._screensaver_img: Optional[PILImage.Image] = None
+        self._screensaver_shown = False
+        # Inputs of the menu frame currently on the panel (None = must render)
+        self._frame_key: Optional[tuple] = None
 
         # Apply initial brightness and show splash
         self._apply_brightness(self.get_settings().get("display", {}).get("brightness", 100))
         self._show_splash_once()
 
+        # SPI pushes run on their own thread so rendering the next frame
+        # overlaps the ~10-20 ms transfer of the previous one. They share a
+        # single frame slot: a newer frame replaces one still waiting.
+        self._spi_cv = threading.Condition()
+        self._spi_frame: Optional[PILImage.Image] = None
+        self._spi_stop = False
+        self._spi_thread = threading.Thread(target=self._spi_worker, daemon=True)
+        self._spi_thread.start()
+
     # -------- helpers --------
+    def _show(self, img: PILImage.Image):
+        """Push an upright image to the panel, applying the startup rotation."""
+        op = self._transpose_op
+        self.disp.ShowImage(img if op is None else img.transpose(op))
+
+    def _present(self, img: PILImage.Image):
+        """Hand an upright image to the SPI worker, replacing any frame it
+        has not picked up yet."""
+        op = self._transpose_op
+        frame = img.copy() if op is None else img.transpose(op)
+        with self._spi_cv:
+            self._spi_frame = frame
+            self._spi_cv.notify()
+
+    @staticmethod
+    def _dirty_rows(last: Optional[np.ndarray], cur: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Band ``(y0, y1)`` of rows that differ from the last pushed frame.
+
+        ``None`` means push everything (nothing on the panel to diff against);
+        an empty band ``(0, 0)`` means the panel already shows ``cur``.
+        """
+        if last is None or last.shape != cur.shape:
+            return None
+        changed = np.flatnonzero((last != cur).any(axis=(1, 2)))
+        if not len(changed):
+            return (0, 0)
+        return int(changed[0]), int(changed[-1]) + 1
+
+    def _spi_worker(self):
+        last = None  # pixels of the frame currently on the panel
+        while True:
+            with self._spi_cv:
+                while self._spi_frame is None and not self._spi_stop:
+                    self._spi_cv.wait()
+                frame, self._spi_frame = self._spi_frame, None
+            if frame is None:
+                return  # stopped with nothing left to push
+            cur = np.asarray(frame)
+            rows = self._dirty_rows(last, cur)
+            if rows == (0, 0):
+                continue
+            try:
+                # Menu moves and clock ticks touch a few rows; only resend those
+                self.disp.ShowImage(frame, rows=rows)
+                last = cur
+            except Exception:
+                last = None
+                logging.exception("LCD update failed")
+
+    def _stop_spi_worker(self):
+        try:
+            with self._spi_cv:
+                self._spi_stop = True
+                self._spi_cv.notify()
+            self._spi_thread.join(timeout=1.0)
+        except Exception:
+            pass
+
     def _apply_brightness(self, val: int):
         """Map 0..100 to driver backlight if available; fallback on/off."""
         try:
@@ -99,6 +180,9 @@ class DisplayThread(threading.Thread):
             logging.warning("Invalid brightness value %r; defaulting to 100", val)
             val = 100
         val = max(0, min(100, val))
+        if val == self._last_brightness:
+            return  # unchanged; skip the PWM driver write
+        self._last_brightness = val
         try:
             # Many Waveshare drivers accept 0..100 for duty
             self.disp.bl_DutyCycle(val)
@@ -111,12 +195,38 @@ class DisplayThread(threading.Thread):
             except Exception:
                 pass
 
+    def _load_splash(self) -> bytes:
+        """Splash as panel-ready RGB565 bytes, cached in assets_dir.
+
+        The cache is already sized, rotated and packed for this panel, so
+        later boots send it straight to SPI without touching the PNG.
+        """
+        src = os.path.join(self.assets_dir, "splash.png")
+        cached = os.path.join(
+            self.assets_dir, f"splash_{self.panel_w}x{self.panel_h}_r{self._rot}.rgb565"
+        )
+        try:
+            if (os.path.getmtime(cached) >= os.path.getmtime(src)
+                    and os.path.getsize(cached) == self.panel_w * self.panel_h * 2):
+                with open(cached, "rb") as f:
+                    return f.read()
+        except OSError:
+            pass  # no cached copy yet (or source missing)
+        splash = Image.open(src).convert("RGB").resize((self.W, self.H))
+        op = self._transpose_op
+        if op is not None:
+            splash = splash.transpose(op)
+        buf = self.disp.rgb565(np.asarray(splash))
+        try:
+            with open(cached, "wb") as f:
+                f.write(buf)
+        except OSError:
+            pass  # read-only assets dir; rebuild next boot
+        return buf
+
     def _show_splash_once(self):
         try:
-            from PIL import Image
-            splash = Image.open(f"{self.assets_dir}/splash.png").convert("RGB")
-            splash = splash.resize((self.W, self.H))
-            self.disp.ShowImage(_orient(splash, self._rot))
+            self.disp.ShowRGB565(self._load_splash(), self.panel_w, self.panel_h)
             time.sleep(3)
         except Exception:
             pass  # no splash available, or load failed — ignore
@@ -136,61 +246,85 @@ class DisplayThread(threading.Thread):
         return idle_s >= (sleep_after - 10)
 
     def _render_screensaver(self):
-        # Simple standby frame
-        from PIL import ImageDraw
-        from app.ui_render import load_font
-        d = ImageDraw.Draw(self.canvas)
-        d.rectangle((0, 0, self.W, self.H), fill="black")
-        msg = "Screensaver"
-        f = load_font(22)
-        tw = d.textlength(msg, font=f)
-        d.text(((self.W - tw) // 2, self.H // 2 - 12), msg, fill="gray", font=f)
-        self.disp.ShowImage(_orient(self.canvas, self._rot))
+        # Simple standby frame; static, so it is drawn once and pushed once
+        if self._screensaver_shown:
+            return
+        if self._screensaver_img is None:
+            from PIL import ImageDraw
+            from app.ui_render import load_font
+            img = Image.new("RGB", (self.W, self.H), "black")
+            d = ImageDraw.Draw(img)
+            msg = "Screensaver"
+            f = load_font(22)
+            tw = d.textlength(msg, font=f)
+            d.text(((self.W - tw) // 2, self.H // 2 - 12), msg, fill="gray", font=f)
+            self._screensaver_img = img
+        self._present(self._screensaver_img)
+        self._screensaver_shown = True
+
+    def _wait_for_change(self, timeout: float) -> None:
+        """Sleep until the menu reports a change or ``timeout`` elapses."""
+        changed = getattr(self.controller, "changed", None)
+        if changed is None:
+            time.sleep(min(timeout, 0.02))  # controller without change events: poll
+        elif changed.wait(timeout):
+            changed.clear()
 
     # -------- thread run loop --------
     def run(self):
         try:
             while not self.stop_evt.is_set():
                 settings = self.get_settings()
-                theme = self.get_theme()
+                disp_cfg = settings.get("display", {})
 
                 # idle time since last input
-                idle = time.time() - self.controller.last_input_ts
+                idle = time.monotonic() - self.controller.last_input_ts
 
                 # sleeping?
                 if self._sleeping(idle, settings):
                     # turn off backlight and idle; any button will update last_input_ts and wake us
                     self._apply_brightness(0)
-                    time.sleep(0.2)
+                    self._wait_for_change(0.2)
                     continue
 
                 # screensaver?
                 if self._screensaver(idle, settings):
                     # dim a bit during saver
-                    target = max(5, int(settings.get("display", {}).get("brightness", 100)) // 4)
+                    target = max(5, int(disp_cfg.get("brightness", 100)) // 4)
                     self._apply_brightness(target)
                     self._render_screensaver()
-                    time.sleep(0.05)
+                    self._wait_for_change(0.05)
                     continue
 
                 # apply brightness if changed (only when active)
-                self._apply_brightness(settings.get("display", {}).get("brightness", 100))
+                self._apply_brightness(disp_cfg.get("brightness", 100))
 
                 # normal render throttled
-                now = time.time()
+                now = time.monotonic()
                 if now - self._last_render >= RENDER_INTERVAL:
                     view = self.controller.view()
                     status = self.status.snapshot()
-                    render_menu(self.canvas, view, status, theme)
-                    self.disp.ShowImage(_orient(self.canvas, self._rot))
+                    theme = self.get_theme()
+                    # View and status parts are cached upstream, so an idle UI
+                    # yields an equal key and we skip both drawing and SPI
+                    key = (view, status.get("time"), status.get("wifi"),
+                           status.get("footer"), theme)
+                    if self._screensaver_shown or key != self._frame_key:
+                        render_menu(self.canvas, view, status, theme)
+                        self._present(self.canvas)
+                        self._frame_key = key
+                        self._screensaver_shown = False
                     self._last_render = now
-
-                time.sleep(0.02)
+                    self._wait_for_change(IDLE_REFRESH_S)
+                else:
+                    # Input arrived inside the throttle window; render when it ends
+                    time.sleep(RENDER_INTERVAL - (now - self._last_render))
         finally:
+            # let a pending frame finish before drawing the final black one
+            self._stop_spi_worker()
             # clear screen and backlight off
             try:
-                self.canvas.paste((0, 0, 0), (0, 0, self.W, self.H))
-                self.disp.ShowImage(_orient(self.canvas, self._rot))
+                self._show(Image.new("RGB", (self.W, self.H), "black"))
             except Exception:
                 pass
             self._apply_brightness(0)
@@ -214,19 +348,14 @@ class ButtonsThread(threading.Thread):
 
     def run(self):
         try:
-            mapping = {
-                "UP":     lambda: self._fire("UP"),
-                "DOWN":   lambda: self._fire("DOWN"),
-                "SELECT": lambda: self._fire("SELECT"),
-                "BACK":   lambda: self._fire("BACK"),
-            }
             for name, pin in BTN_PINS.items():
                 b = Button(pin, pull_up=True, bounce_time=DEBOUNCE_S)
-                b.when_pressed = mapping[name]
+                b.when_pressed = partial(self._fire, name)
                 self.buttons.append(b)
 
-            while not self.stop_evt.is_set():
-                time.sleep(0.05)
+            # gpiozero dispatches presses from its own thread; this one only
+            # owns the buttons' lifetime, so block until shutdown
+            self.stop_evt.wait()
         finally:
             for b in self.buttons:
                 try:
@@ -14,7 +14,9 @@ that unit tests can provide a dummy serial object.
 
 from __future__ import annotations
 
+import functools
 import logging
+import struct
 import threading
 import time
 from typing import Any, Callable, Optional, Tuple
@@ -29,6 +31,21 @@ except Exception:  # pragma: no cover - serial fallback
 
 Color = Tuple[int, int, int]
 
+# Teensy frame header: magic (4 bytes), pixel count (u16 LE), brightness
+_HDR = struct.Struct("<4sHB")
+_MAGIC = b"\xAB\xCD\xF1\x00"
+HEADER_LEN = _HDR.size
+
+# How long a brightness value read from settings is reused
+_BRIGHTNESS_TTL_S = 1.0
+
+# Upper bound on a single frame write before giving up on it
+_WRITE_TIMEOUT_S = 0.5
+
+# Unterminated ack bytes kept before the buffer is dropped (noise, wrong baud)
+_RX_MAX_PENDING = 4096
+_rx_overflow_logged = False
+
 
 # ---------------------------------------------------------------------------
 # Helper functions mirroring the standalone script
@@ -53,25 +70,85 @@ def build_solid_grb(w: int, h: int, su: int, rgb: Color) -> bytes:
     return trip * (w * h * su)
 
 
-def send_frame(ser: Any, payload_grb: bytes, brightness: int) -> None:
-    """Send a frame payload to ``ser`` using the Teensy framing protocol."""
+@functools.lru_cache(maxsize=32)
+def _solid_grb_cached(rgb: Color, w: int, h: int, su: int) -> bytes:
+    """Memoized :func:`build_solid_grb`; solid fills reuse a handful of colors."""
+
+    return build_solid_grb(w, h, su, rgb)
+
+
+def pack_frame(
+    payload_grb: bytes | memoryview, brightness: int, out: Optional[bytearray] = None
+) -> memoryview:
+    """Write header + ``payload_grb`` into ``out`` and return a view of the frame.
+
+    ``out`` is grown if it is too small; passing the same buffer on every call
+    avoids allocating a new frame per send.
+    """
 
-    num = len(payload_grb) // 3
-    hdr = bytes(
-        (0xAB, 0xCD, 0xF1, 0x00, num & 0xFF, (num >> 8) & 0xFF, brightness & 0xFF)
-    )
-    ser.write(hdr + payload_grb)
-    ser.flush()
-    ser.timeout = 2
-    # read optional acknowledgement line
+    n = len(payload_grb)
+    if out is None:
+        out = bytearray(HEADER_LEN + n)
+    elif len(out) < HEADER_LEN + n:
+        out.extend(bytes(HEADER_LEN + n - len(out)))
+    _HDR.pack_into(out, 0, _MAGIC, (n // 3) & 0xFFFF, brightness & 0xFF)
+    out[HEADER_LEN:HEADER_LEN + n] = payload_grb
+    return memoryview(out)[: HEADER_LEN + n]
+
+
+def send_frame(
+    ser: Any,
+    payload_grb: bytes | memoryview,
+    brightness: int,
+    tx: Optional[bytearray] = None,
+    rx: Optional[bytearray] = None,
+) -> None:
+    """Send a frame payload to ``ser`` using the Teensy framing protocol.
+
+    ``payload_grb`` may be any bytes-like object (e.g. a ``memoryview`` over a
+    reused buffer); it is only read for the duration of the call. Header and
+    payload go out in a single ``write``, assembled in ``tx`` when given.
+    Incomplete acknowledgement lines are kept in ``rx`` for the next call.
+    """
+
+    ser.write(pack_frame(payload_grb, brightness, tx))
+    # Log any acknowledgement already received, without waiting for one;
+    # the kernel drains the TX queue on its own, so no flush()/tcdrain here
     try:
-        line = ser.readline().decode("utf-8", "ignore").strip()
-        if line:
-            logging.info("Teensy: %s", line)
+        waiting = ser.in_waiting
+        if waiting:
+            if rx is None:
+                rx = bytearray()
+            rx += ser.read(waiting)
+            _log_rx_lines(rx)
     except Exception:
         pass
 
 
+def _log_rx_lines(rx: bytearray) -> None:
+    """Log and remove every complete line in ``rx``; keep the partial tail.
+
+    A tail longer than ``_RX_MAX_PENDING`` is never going to end in a newline
+    worth logging, so it is discarded rather than left to grow.
+    """
+    global _rx_overflow_logged
+
+    end = rx.rfind(b"\n")
+    if end >= 0:
+        for line in rx[:end].decode("utf-8", "ignore").splitlines():
+            if line.strip():
+                logging.info("Teensy: %s", line.strip())
+        del rx[: end + 1]
+    if len(rx) > _RX_MAX_PENDING:
+        if not _rx_overflow_logged:
+            _rx_overflow_logged = True
+            logging.warning(
+                "Teensy: dropping %d bytes of unterminated serial input "
+                "(check baud rate / firmware)", len(rx)
+            )
+        rx.clear()
+
+
 # ---------------------------------------------------------------------------
 # Thread implementation
 
@@ -103,10 +180,50 @@ class LEDThread(threading.Thread):
 
         # serialize writes to the Teensy
         self._io_lock = threading.Lock()
+        # Transmit buffer (header + full-panel payload), reused under _io_lock
+        self._tx = bytearray(HEADER_LEN + width * height * strips_used * 3)
+        # Bytes received from the Teensy that don't yet form a full line
+        self._rx_buf = bytearray()
+        # (color, brightness) of the solid fill currently on the LEDs, if any
+        self._last_solid: Optional[Tuple[Color, int]] = None
+
+        # Double-buffered hand-off from send_raw_frame to the run loop: the
+        # producer fills _back while the run loop transmits _front
+        n = width * height * strips_used * 3
+        self._front = bytearray(n)
+        self._back = bytearray(n)
+        self._back_brightness: Optional[int] = None
+        self._pending = False
+        self._pending_cv = threading.Condition()
+
+        # (monotonic timestamp, value) of the last brightness read from settings
+        self._brightness_cache: Tuple[float, int] = (float("-inf"), brightness)
 
     # ------------------- public API -------------------
-    def send_raw_frame(self, payload_grb: bytes, brightness: Optional[int] = None) -> None:
-        """Send a pre-built GRB payload to the LEDs."""
+    def send_raw_frame(
+        self, payload_grb: bytes | memoryview, brightness: Optional[int] = None
+    ) -> None:
+        """Send a pre-built GRB payload to the LEDs.
+
+        While the thread is running the payload is copied into the back buffer
+        and transmitted by :meth:`run`, so the caller never waits on the UART.
+        A frame still queued when the next one arrives is replaced.
+        """
+        ser = self._ensure_serial()
+        if not ser:
+            return
+        if self.is_alive():
+            with self._pending_cv:
+                self._back[:] = payload_grb
+                self._back_brightness = brightness
+                self._pending = True
+                self._pending_cv.notify()
+            return
+        self._transmit(payload_grb, brightness)
+
+    # ------------------ internal helpers ------------------
+
+    def _transmit(self, payload_grb: bytes | memoryview, brightness: Optional[int]) -> None:
         ser = self._ensure_serial()
         if not ser:
             return
@@ -115,10 +232,11 @@ class LEDThread(threading.Thread):
                 ser,
                 payload_grb,
                 brightness if brightness is not None else self._get_brightness(),
+                self._tx,
+                self._rx_buf,
             )
-        print(f"[LED] frame of {len(payload_grb) // 3} pixels sent")
-
-    # ------------------ internal helpers ------------------
+            self._last_solid = None
+        logging.debug("[LED] frame of %d pixels sent", len(payload_grb) // 3)
 
     def _ensure_serial(self) -> Optional[serial.Serial]:
         if self.ser:
@@ -128,10 +246,21 @@ class LEDThread(threading.Thread):
             self.ser = None
             return None
         try:
-            self.ser = serial.Serial(self.port, 2_000_000, timeout=0.2)
+            # write_timeout keeps a stalled Teensy from hanging the TX path
+            self.ser = serial.Serial(
+                self.port, 2_000_000, timeout=0.2, write_timeout=_WRITE_TIMEOUT_S
+            )
         except Exception as exc:  # pragma: no cover - hardware dependent
             logging.warning("Failed to open serial port %s: %s", self.port, exc)
             self.ser = None
+            return None
+        # Only some platforms (Windows) let the driver buffers be sized
+        set_buffer_size = getattr(self.ser, "set_buffer_size", None)
+        if set_buffer_size is not None:  # pragma: no cover - platform dependent
+            try:
+                set_buffer_size(rx_size=4096, tx_size=max(8192, len(self._tx)))
+            except Exception:
+                pass
         return self.ser
 
     def _close_serial(self) -> None:
@@ -141,8 +270,20 @@ class LEDThread(threading.Thread):
             except Exception:
                 pass
             self.ser = None
+            self._rx_buf.clear()
+            # A reopened port may talk to a reset Teensy; resend the next fill
+            self._last_solid = None
 
     def _get_brightness(self) -> int:
+        # Brightness changes rarely; re-read settings at most once a second
+        ts, value = self._brightness_cache
+        now = time.monotonic()
+        if now - ts >= _BRIGHTNESS_TTL_S:
+            value = self._read_brightness()
+            self._brightness_cache = (now, value)
+        return value
+
+    def _read_brightness(self) -> int:
         try:
             return int(self.get_settings().get("led", {}).get("brightness", self.default_brightness))
         except Exception:
@@ -152,9 +293,15 @@ class LEDThread(threading.Thread):
         ser = self._ensure_serial()
         if not ser:
             return
-        payload = build_solid_grb(self.width, self.height, self.strips_used, color)
+        color = tuple(color)
+        brightness = self._get_brightness()
+        key = (color, brightness)
+        payload = _solid_grb_cached(color, self.width, self.height, self.strips_used)
         with self._io_lock:
-            send_frame(ser, payload, self._get_brightness())
+            if key == self._last_solid:
+                return  # LEDs already show this fill
+            send_frame(ser, payload, brightness, self._tx, self._rx_buf)
+            self._last_solid = key
 
     def _clear_immediate(self) -> None:
         """Immediately clear LEDs to black (thread-safe)."""
@@ -165,17 +312,16 @@ class LEDThread(threading.Thread):
 
     # -------------------- thread loop --------------------
     def run(self) -> None:  # pragma: no cover - contains time-based loop
-        print("[LED] thread starting up")
+        logging.info("[LED] thread starting up")
         ser = self._ensure_serial()
         if not ser:
-            while not self.stop_evt.is_set():
-                time.sleep(0.5)
+            self.stop_evt.wait()
             return
 
         # Flush stale boot text and wait up to 5s for RDY once
         ser.reset_input_buffer()
-        t0 = time.time()
-        while time.time() - t0 < 5.0 and not self.stop_evt.is_set():
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < 5.0 and not self.stop_evt.is_set():
             line = ser.readline().decode("utf-8", "ignore").strip()
             if line:
                 logging.info("Teensy: %s", line)
@@ -184,7 +330,19 @@ class LEDThread(threading.Thread):
 
         try:
             while not self.stop_evt.is_set():
-                time.sleep(0.1)
+                with self._pending_cv:
+                    if not self._pending:
+                        # Timeout only bounds how long a stop request can go unseen
+                        self._pending_cv.wait(timeout=0.5)
+                    if not self._pending:
+                        continue
+                    self._front, self._back = self._back, self._front
+                    brightness = self._back_brightness
+                    self._pending = False
+                try:
+                    self._transmit(self._front, brightness)
+                except Exception as exc:  # pragma: no cover - hardware dependent
+                    logging.warning("LED frame send failed: %s", exc)
         finally:
             # Always leave LEDs off when the thread exits
             try:
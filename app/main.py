@@ -7,16 +7,20 @@
 # - Shows "restart required" indicator when a restart-only setting (e.g., rotation) changes
 # - Starts WebServerThread (HTTP server for LED control)
 
-import json
+import copy
+import logging
+import logging.handlers
 import os
+import queue
+import signal
 import time
 import threading
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 
 from app.interface import DisplayThread, ButtonsThread
 from app.menu_engine import MenuController
 from app.status import StatusProvider
-from app.storage import load_json, save_json_atomic
+from app.storage import dump_json_bytes, load_json, loads_json, save_bytes_atomic, save_json_atomic
 from app.animation_controller import AnimationControllerThread
 from app.web_server import WebServerThread
 from app.led_controller import LEDThread
@@ -25,6 +29,9 @@ from app.led_controller import LEDThread
 MENU_PATH     = "menu.json"
 SETTINGS_PATH = "settings.json"
 
+# Bundled assets live next to this file, independent of the working directory
+ASSETS_DIR    = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
 # Default settings applied if settings.json is missing/corrupt
 DEFAULT_SETTINGS: Dict[str, Any] = {
     "display": {
@@ -51,27 +58,103 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 }
 
 
+DEFAULT_THEME: Dict[str, str] = {"fg": "white", "bg": "black", "accent": "cyan"}
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Route log records through a queue so callers never block on stderr I/O.
+
+    The returned listener owns the real handler on its own thread; stop it
+    at shutdown to flush pending records.
+    """
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(q))
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
 class DebouncedSaver:
-    """Debounce writes to settings.json to reduce SD wear."""
+    """Debounce writes to settings.json to reduce SD wear.
+
+    One long-lived worker thread waits for the debounce deadline; each call
+    only replaces the pending payload and pushes the deadline back.
+    """
     def __init__(self, path: str, delay: float = 0.6):
         self.path = path
         self.delay = delay
-        self._timer = None
-        self._lock = threading.Lock()
+        self._cv = threading.Condition()
+        self._pending = None
+        self._deadline = None
+        self._alive = True
+        # Bytes last written (or found on disk); identical saves are skipped
+        try:
+            with open(path, "rb") as f:
+                self._last_bytes = f.read()
+        except OSError:
+            self._last_bytes = None
+        # False once a routine (un-fsynced) write lands; close() then makes it durable
+        self._durable = True
+        self._worker = threading.Thread(target=self._run, name="DebouncedSaver", daemon=True)
+        self._worker.start()
 
     def __call__(self, data: Dict[str, Any]):
-        with self._lock:
-            if self._timer:
-                self._timer.cancel()
-            self._timer = threading.Timer(self.delay, save_json_atomic, args=(self.path, data))
-            self._timer.daemon = True
-            self._timer.start()
+        # Snapshot now: the caller keeps mutating the live settings dict, and
+        # the worker must never serialize it mid-change
+        snapshot = copy.deepcopy(data)
+        with self._cv:
+            self._pending = snapshot
+            self._deadline = time.monotonic() + self.delay
+            self._cv.notify()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write any pending payload now and stop the worker."""
+        with self._cv:
+            self._alive = False
+            self._cv.notify()
+        self._worker.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while self._alive:
+                    if self._deadline is None:
+                        self._cv.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cv.wait(remaining)
+                data, self._pending, self._deadline = self._pending, None, None
+                alive = self._alive
+            try:
+                buf = self._last_bytes if data is None else dump_json_bytes(data)
+                # e.g. DOWN then UP: nothing changed, spare the SD card. The
+                # final pass still rewrites unchanged bytes if the last write
+                # skipped fsync, so the settings on disk survive power loss
+                if buf is not None and (buf != self._last_bytes or not (alive or self._durable)):
+                    # Routine edits skip fsync; the final write at close() is durable
+                    save_bytes_atomic(self.path, buf, durable=not alive, keep_backup=not alive)
+                    self._last_bytes = buf
+                    self._durable = not alive
+            except Exception as exc:
+                logging.warning("[Alis] settings save failed: %s", exc)
+            if not alive:
+                return
 
 
 def main():
+    # ALIS_DEBUG=1 enables debug records; otherwise they are dropped at the logger
+    debug = os.environ.get("ALIS_DEBUG") == "1"
+    log_listener = setup_logging(logging.DEBUG if debug else logging.INFO)
+
     # 1) Load menu spec
-    with open(MENU_PATH, "r") as f:
-        menu_spec = json.load(f)
+    with open(MENU_PATH, "rb") as f:
+        menu_spec = loads_json(f.read())
 
     # 2) Load settings (merge defaults, write file if missing/corrupt)
     settings: Dict[str, Any] = load_json(SETTINGS_PATH, DEFAULT_SETTINGS)
@@ -94,29 +177,36 @@ def main():
     anim_thread = AnimationControllerThread(stop_evt=stop_evt, led_thread=led_thread)
     web_thread = WebServerThread(stop_evt=stop_evt, anim_thread=anim_thread)
 
-    # Menu action handler
+    # Menu action handler: register new actions here
+    actions: Dict[str, Callable[[], None]] = {
+        "led.rgb_cycle": lambda: anim_thread.set_mode("test"),
+        "led.stop":      lambda: anim_thread.set_mode("idle"),
+    }
+
     def action_handler(name: str) -> None:
-        if name == "led.rgb_cycle":
-            anim_thread.set_mode("test")
-        elif name == "led.stop":
-            anim_thread.set_mode("idle")
+        fn = actions.get(name)
+        if fn is not None:
+            fn()
         else:
-            print(f"[Menu] action requested: {name}")
+            logging.info("[Menu] action requested: %s", name)
+
+    # 4) Create status provider (for top bar) and controller (pure logic);
+    #    the controller pushes the "↻" restart flag straight to the status bar
+    status     = StatusProvider(settings, web_port=web_thread.port)
+    controller = MenuController(
+        menu_spec, settings, save_cb=save_cb, action_cb=action_handler,
+        restart_cb=status.set_restart_required,
+    )
 
-    # 4) Create controller (pure logic) and status provider (for top bar)
-    controller = MenuController(menu_spec, settings, save_cb=save_cb, action_cb=action_handler)
-    status     = StatusProvider(settings, web_port=web_thread.port)   # pass settings so it can expose "↻" when needed
+    # 5) Helpers for the display thread to fetch current theme (static; resolved once)
+    theme: Dict[str, str] = menu_spec.get("theme", DEFAULT_THEME)
 
-    # 5) Helpers for the display thread to fetch current theme
     def get_theme() -> Dict[str, str]:
-        return menu_spec.get("theme", {"fg": "white", "bg": "black", "accent": "cyan"})
+        return theme
 
     # 6) Read rotation ONCE from settings and pass into DisplayThread
     rotation = int(settings.get("display", {}).get("rotation", 0)) % 360
 
-    # Resolve assets directory relative to this file
-    assets_path = os.path.join(os.path.dirname(__file__), "assets")
-
     # 7) Spin up threads
     disp_thread = DisplayThread(
         stop_evt=stop_evt,
@@ -124,23 +214,40 @@ def main():
         status_provider=status,
         get_theme=get_theme,
         get_settings=get_settings,
-        assets_dir=assets_path,
+        assets_dir=ASSETS_DIR,
         rotation=rotation,              # <-- applied once at startup
     )
     btn_thread  = ButtonsThread(stop_evt=stop_evt, controller=controller)
 
+    # SIGINT (Ctrl+C) and SIGTERM (systemd stop) both request a clean shutdown
+    def _request_stop(signum, frame) -> None:
+        stop_evt.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    # A worker dying with an exception shuts everything down; otherwise the
+    # main thread would wait on stop_evt forever with part of the app gone
+    def _thread_crashed(args: threading.ExceptHookArgs) -> None:
+        if args.exc_type is SystemExit:
+            return
+        name = args.thread.name if args.thread else "?"
+        logging.error("[Alis] thread %s crashed", name,
+                      exc_info=(args.exc_type, args.exc_value, args.exc_traceback))
+        stop_evt.set()
+
+    threading.excepthook = _thread_crashed
 
     try:
+        status.start(stop_evt)
         led_thread.start()
         disp_thread.start()
         btn_thread.start()
         anim_thread.start()
         web_thread.start()
-        # Main thread can host future supervisors/services
-        while True:
-            time.sleep(1.0)
-    except KeyboardInterrupt:
-        print("\n[Alis] Shutting down…")
+        # Block until a signal or a crashed thread sets stop_evt; no periodic wakeups
+        stop_evt.wait()
+        logging.info("[Alis] Shutting down…")
     finally:
         stop_evt.set()
         # Give threads a moment to exit cleanly
@@ -149,9 +256,11 @@ def main():
         anim_thread.join(timeout=2.0)
         web_thread.join(timeout=2.0)
         led_thread.join(timeout=2.0)
-        # Ensure final settings are flushed
-        save_json_atomic(SETTINGS_PATH, settings)
-        print("[Alis] Stopped.")
+        # Ensure final settings are flushed (skipped if already on disk)
+        save_cb(settings)
+        save_cb.close()
+        logging.info("[Alis] Stopped.")
+        log_listener.stop()
 
 
 if __name__ == "__main__":
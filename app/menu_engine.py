@@ -2,7 +2,7 @@
 # Data-driven menu controller for Alis
 # - Consumes a JSON menu spec (menu.json)
 # - Edits a settings dict in-place (settings.json persisted via save_cb)
-# - Produces a view-model dict for the renderer (title + list of items)
+# - Produces a view-model dict for the renderer (title + tuple of RowView items)
 # - Handles navigation with events: "UP", "DOWN", "SELECT", "BACK"
 #
 # Notes:
@@ -14,8 +14,11 @@
 # The renderer is intentionally separate (see app/ui_render.py).
 
 from __future__ import annotations
+import logging
+import threading
 import time
-from typing import Any, Dict, List, Callable, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Callable, NamedTuple, Optional, Tuple
 
 Event = str  # "UP" | "DOWN" | "SELECT" | "BACK"
 
@@ -35,13 +38,74 @@ RESTART_BINDINGS = {
 }
 
 
+class RowView(NamedTuple):
+    """One rendered menu row, as handed to the renderer (immutable)."""
+    type: Optional[str]
+    label: str
+    value: str
+    focused: bool
+    live: bool
+    restart: bool
+
+
+@dataclass(slots=True)
+class _Row:
+    """One menu item from the spec, pre-parsed once at controller init."""
+    type: Optional[str]
+    label: str
+    binding_parts: Optional[Tuple[str, ...]] = None
+    live: bool = True
+    restart: bool = False
+    step: int = 1
+    min: Optional[int] = None
+    max: Optional[int] = None
+    options: Optional[Tuple[Any, ...]] = None
+    options_source: Optional[str] = None
+    to: Optional[str] = None
+    action: Optional[str] = None
+
+    @classmethod
+    def from_spec(cls, it: Dict[str, Any]) -> "_Row":
+        row = cls(type=it.get("type"), label=it.get("label", ""))
+        binding = it.get("binding")
+        if binding is not None:
+            row.binding_parts = tuple(binding.split("."))
+            row.live = binding in LIVE_BINDINGS
+            row.restart = binding in RESTART_BINDINGS
+        row.step = int(it.get("step", 1))
+        if "min" in it:
+            row.min = int(it["min"])
+        if "max" in it:
+            row.max = int(it["max"])
+        if "options" in it:
+            row.options = tuple(it["options"])
+        row.options_source = it.get("options_source")
+        row.to = it.get("to")
+        row.action = it.get("action")
+        return row
+
+
+@dataclass(slots=True)
+class _Screen:
+    """A pre-parsed screen: its title and rows."""
+    title: str
+    rows: Tuple[_Row, ...]
+
+    @classmethod
+    def from_spec(cls, scr: Dict[str, Any]) -> "_Screen":
+        return cls(
+            title=scr.get("title", ""),
+            rows=tuple(_Row.from_spec(it) for it in scr.get("items", [])),
+        )
+
+
 class MenuController:
     """
     Pure-logic menu controller:
       - Holds the current screen id and focus index
       - Applies edits to settings (toggle/number/select)
       - Exposes a view() dict for the renderer
-      - Tracks last_input_ts for sleep/screensaver
+      - Tracks last_input_ts (time.monotonic()) for sleep/screensaver
     """
 
     def __init__(
@@ -50,43 +114,76 @@ class MenuController:
         settings: Dict[str, Any],
         save_cb: Callable[[Dict[str, Any]], None],
         action_cb: Optional[Callable[[str], None]] = None,
+        restart_cb: Optional[Callable[[], None]] = None,
     ):
         self.spec = menu_spec
         self.settings = settings
         self.save_cb = save_cb
         self.action_cb = action_cb
+        self.restart_cb = restart_cb
         self.stack: List[str] = [menu_spec.get("root", "home")]
         self.focus_idx: int = 0
-        self.last_input_ts: float = time.time()
+        self.last_input_ts: float = time.monotonic()
+        # Items parsed once; view()/on_event() never re-interpret the spec
+        self._screens: Dict[str, _Screen] = {
+            sid: _Screen.from_spec(scr) for sid, scr in menu_spec.get("screens", {}).items()
+        }
+        # view() result, rebuilt only after an event or settings edit
+        self._view_cache: Optional[Dict[str, Any]] = None
+        self._dirty = True
+        # Set after every handled event; the display thread blocks on it
+        # instead of polling for changes
+        self.changed = threading.Event()
 
     # ------------------ Public API ------------------
 
     def on_event(self, ev: Event) -> None:
         """Handle navigation / activation events."""
-        self.last_input_ts = time.time()
-        screen = self.current_screen()
-        items = self._resolved_items(screen.get("items", []))
-        if ev == "UP":
-            if items:
-                self.focus_idx = (self.focus_idx - 1) % len(items)
-        elif ev == "DOWN":
-            if items:
-                self.focus_idx = (self.focus_idx + 1) % len(items)
-        elif ev == "BACK":
-            if len(self.stack) > 1:
-                self.stack.pop()
-                self.focus_idx = 0
-        elif ev == "SELECT":
-            self._activate(items, self.focus_idx)
+        handler = self._DISPATCH.get(ev)
+        if handler is None:
+            return
+        self.last_input_ts = time.monotonic()
+        handler(self, self._screens[self.current_screen_id()].rows)
+        # Dirty only after the handler: a view() built mid-event would
+        # otherwise clear the flag and cache the pre-event state
+        self._dirty = True
+        self.changed.set()
+
+    def _move(self, items: Tuple[_Row, ...], delta: int) -> None:
+        if items:
+            self.focus_idx = (self.focus_idx + delta) % len(items)
+
+    def _back(self, items: Tuple[_Row, ...]) -> None:
+        if len(self.stack) > 1:
+            self.stack.pop()
+            self.focus_idx = 0
+
+    def _select(self, items: Tuple[_Row, ...]) -> None:
+        self._activate(items, self.focus_idx)
+
+    _DISPATCH: Dict[str, Callable[["MenuController", Tuple[_Row, ...]], None]] = {
+        "UP": lambda self, items: self._move(items, -1),
+        "DOWN": lambda self, items: self._move(items, 1),
+        "BACK": _back,
+        "SELECT": _select,
+    }
 
     def view(self) -> Dict[str, Any]:
-        """Return a renderer-friendly dict with title + item rows."""
-        s = self.current_screen()
-        items = self._resolved_items(s.get("items", []))
-        return {
-            "title": s.get("title", ""),
-            "items": [self._item_view(it, i == self.focus_idx) for i, it in enumerate(items)],
+        """Return a renderer-friendly dict with title + item rows.
+
+        The dict is cached and shared between calls; treat it as read-only.
+        """
+        if not self._dirty and self._view_cache is not None:
+            return self._view_cache
+        # Clear first: an event landing mid-build re-dirties the cache
+        self._dirty = False
+        s = self._screens[self.current_screen_id()]
+        self._view_cache = {
+            "title": s.title,
+            "focus_idx": self.focus_idx,
+            "items": tuple(self._item_view(it, i == self.focus_idx) for i, it in enumerate(s.rows)),
         }
+        return self._view_cache
 
     def current_screen_id(self) -> str:
         return self.stack[-1]
@@ -96,40 +193,40 @@ class MenuController:
 
     # ------------------ Internal helpers ------------------
 
-    def _activate(self, items: List[Dict[str, Any]], idx: int) -> None:
+    def _activate(self, items: Tuple[_Row, ...], idx: int) -> None:
         if not items:
             return
         it = items[idx]
-        t = it.get("type")
+        t = it.type
         if t == "screen-link":
-            to = it.get("to")
-            if to and to in self.spec.get("screens", {}):
+            to = it.to
+            if to and to in self._screens:
                 self.stack.append(to)
                 self.focus_idx = 0
             return
 
         if t == "toggle":
-            binding = it.get("binding")
+            binding = it.binding_parts
             if not binding:
                 return
             new_val = not bool(self._get_binding(binding, False))
-            self._apply_binding(binding, new_val)
+            self._apply_binding(it, new_val)
             return
 
         if t == "number":
-            binding = it.get("binding")
+            binding = it.binding_parts
             if not binding:
                 return
             cur = int(self._get_binding(binding, 0))
-            step = int(it.get("step", 1))
-            mn = int(it.get("min", cur - step * 10))
-            mx = int(it.get("max", cur + step * 10))
+            step = it.step
+            mn = it.min if it.min is not None else cur - step * 10
+            mx = it.max if it.max is not None else cur + step * 10
             new_val = max(mn, min(mx, cur + step))  # bump on SELECT
-            self._apply_binding(binding, new_val)
+            self._apply_binding(it, new_val)
             return
 
         if t == "select":
-            binding = it.get("binding")
+            binding = it.binding_parts
             if not binding:
                 return
             opts = self._options(it)
@@ -141,102 +238,86 @@ class MenuController:
             except ValueError:
                 i = -1
             new_val = opts[(i + 1) % len(opts)]
-            self._apply_binding(binding, new_val)
+            self._apply_binding(it, new_val)
             return
 
         if t == "action":
-            action = it.get("action")
+            action = it.action
             if self.action_cb and action:
                 self.action_cb(action)
             else:
                 # Fallback: log the requested action
-                print(f"[Menu] action requested: {action}")
+                logging.info("[Menu] action requested: %s", action)
             return
 
         # info/group/unknown: no-op on SELECT
 
-    def _apply_binding(self, binding: str, value: Any) -> None:
+    def _apply_binding(self, it: _Row, value: Any) -> None:
         """Write a value into the nested settings dict and persist (debounced)."""
-        self._set_binding(binding, value)
+        self._set_binding(it.binding_parts, value)
+        self._dirty = True
         # Mark restart-needed if applicable
-        if binding in RESTART_BINDINGS:
+        if it.restart:
             sys = self.settings.setdefault("system", {})
             sys["restart_required"] = True
+            if self.restart_cb:
+                self.restart_cb()
         # Persist (debounced by the provided callback)
         self.save_cb(self.settings)
 
-    def _item_view(self, it: Dict[str, Any], focused: bool) -> Dict[str, Any]:
-        """Produce a small dict per row for rendering."""
-        t = it.get("type")
-        label = it.get("label", "")
-
-        live = True
-        restart = False
-        if "binding" in it:
-            b = it["binding"]
-            live = b in LIVE_BINDINGS
-            restart = b in RESTART_BINDINGS
+    def _item_view(self, it: _Row, focused: bool) -> RowView:
+        """Produce a small immutable record per row for rendering."""
+        t = it.type
+        binding = it.binding_parts
 
         # Value string shown on the right
         if t in ("group", "action"):
             value = ""
-        elif t == "info" and "binding" in it:
-            value = str(self._get_binding(it["binding"], ""))
+        elif t == "info" and binding:
+            value = str(self._get_binding(binding, ""))
         elif t == "info":
             value = ""
         elif t == "toggle":
-            value = "ON" if self._get_binding(it["binding"], False) else "OFF"
+            value = "ON" if self._get_binding(binding, False) else "OFF"
         elif t == "number":
-            value = str(self._get_binding(it["binding"], 0))
+            value = str(self._get_binding(binding, 0))
         elif t == "select":
-            value = str(self._get_binding(it["binding"], ""))
+            value = str(self._get_binding(binding, ""))
         elif t == "screen-link":
             value = "›"
         else:
             value = ""
 
-        return {
-            "type": t,
-            "label": label,
-            "value": value,
-            "focused": focused,
-            "live": live,
-            "restart": restart,
-        }
+        return RowView(t, it.label, value, focused, it.live, it.restart)
 
-    def _resolved_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Resolve dynamic fields like options_source before rendering/activation."""
-        out: List[Dict[str, Any]] = []
-        for it in items:
-            if it.get("type") == "select" and "options_source" in it:
-                tmp = dict(it)
-                tmp["options"] = self._options(tmp)
-                out.append(tmp)
-            else:
-                out.append(it)
-        return out
-
-    def _options(self, it: Dict[str, Any]) -> List[Any]:
+    def _options(self, it: _Row) -> List[Any]:
         """Provide options for 'select' items either from spec or a dynamic source."""
-        src = it.get("options_source")
+        src = it.options_source
         if src == "programs.list":
             # Placeholder until you wire real discovery:
             return ["Default", "Arcade", "Kiosk"]
         # Fallback to static options array
-        return list(it.get("options", []))
+        return list(it.options or ())
 
     # -------------- Settings path helpers --------------
 
-    def _get_binding(self, path: str, default: Any = None) -> Any:
+    def _get_binding(self, parts: Tuple[str, ...], default: Any = None) -> Any:
+        if len(parts) == 2:
+            # Every current binding is "section.key": two plain lookups
+            section = self.settings.get(parts[0])
+            return section.get(parts[1], default) if isinstance(section, dict) else default
         node: Any = self.settings
-        for part in path.split("."):
-            if not isinstance(node, dict) or part not in node:
-                return default
-            node = node[part]
+        try:
+            for part in parts:
+                node = node[part]
+        except (KeyError, TypeError):  # missing key, or a non-dict on the path
+            return default
         return node
 
-    def _set_binding(self, path: str, value: Any) -> None:
-        parts = path.split(".")
+    def _set_binding(self, parts: Tuple[str, ...], value: Any) -> None:
+        if len(parts) == 2:
+            self.settings.setdefault(parts[0], {})[parts[1]] = value
+            return
         node = self.settings
         for p in parts[:-1]:
             node = node.setdefault(p, {})
@@ -1,56 +1,185 @@
 # app/status.py
+import array
+import fcntl
+import re
+import struct
 import subprocess
+import threading
 import time
 import socket
 from typing import Dict, Tuple, List, Optional, Any
 
+# Seconds between Wi-Fi status reads
+WIFI_POLL_S = 10.0
+# The SSID rarely changes; re-read it at most this often while connected
+SSID_REFRESH_S = 30.0
+# The local IP almost never changes; re-probe it this often (or on Wi-Fi change)
+IP_REFRESH_S = 600.0
+
+PROC_NET_WIRELESS = "/proc/net/wireless"
+_SIOCGIWESSID = 0x8B1B
+_IW_ESSID_MAX_SIZE = 32
+# Quoted ESSID in iwconfig output (unassociated interfaces print ESSID:off/any)
+_ESSID_RE = re.compile(rb'ESSID:"([^"]+)"')
+
+
+def _read_proc_wireless(path: str) -> Optional[Tuple[str, float]]:
+    """Return ``(iface, link_quality)`` of the first wireless interface.
+
+    ``("", 0.0)`` means the kernel reports no wireless interface; ``None``
+    means the file is unavailable (non-Linux, no wireless extensions).
+    """
+    try:
+        with open(path, "r") as f:
+            lines = f.readlines()[2:]  # two header lines
+    except OSError:
+        return None
+    for line in lines:
+        iface, sep, rest = line.partition(":")
+        fields = rest.split()
+        if not sep or len(fields) < 2:
+            continue
+        try:
+            return iface.strip(), float(fields[1].rstrip("."))
+        except ValueError:
+            continue
+    return "", 0.0
+
+
+def _ioctl_essid(iface: str) -> Optional[str]:
+    """Read the ESSID of ``iface`` via the SIOCGIWESSID ioctl (no fork)."""
+    buf = array.array("B", bytes(_IW_ESSID_MAX_SIZE + 1))
+    addr, _ = buf.buffer_info()
+    # struct iwreq: ifname[16] + struct iw_point {void *pointer; u16 length; u16 flags}
+    req = struct.pack("16sPHH", iface.encode()[:15], addr, len(buf), 0)
+    req += bytes(max(0, 32 - len(req)))
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        res = fcntl.ioctl(s.fileno(), _SIOCGIWESSID, req)
+    except OSError:
+        return None
+    finally:
+        s.close()
+    length = struct.unpack_from("16sPHH", res)[2]
+    return buf.tobytes()[: min(length, _IW_ESSID_MAX_SIZE)].rstrip(b"\0").decode("utf-8", "replace")
+
+
 class StatusProvider:
     def __init__(self, settings: Dict, web_port: int = 0):
         self.settings = settings
         self.web_port = web_port
-        self._last_wifi_check = 0
+        # Pushed by the menu via set_restart_required(); no per-frame dict walk
+        self.restart_required = bool(settings.get("system", {}).get("restart_required"))
+        self._last_wifi_check = float("-inf")
+        # Rebound as a whole tuple, so readers never see a torn update
         self._wifi_cached = (False, "")
-        self._last_ip_check = 0.0
+        self._poller: Optional[threading.Thread] = None
+        # Status-bar icons and the (connected, restart) state they were built for
+        self._bar_state: Optional[Tuple[bool, bool]] = None
+        self._bar_right: List[Tuple[str, Optional[str]]] = []
+        # (iface, ssid, monotonic ts) of the last SSID ioctl
+        self._ssid_cached: Tuple[str, Optional[str], float] = ("", None, 0.0)
+        self._last_ip_check = float("-inf")
         self._ip_cached: str = ""
+        # "HH:MM" only changes once a minute; format it once per minute
+        self._last_min = -1
+        self._time_str = ""
+        # Last snapshot dict and the (bar state, time, footer) it was built from
+        self._snap_key: Optional[Tuple[Any, ...]] = None
+        self._snap: Dict[str, Any] = {}
+
+    def set_restart_required(self, required: bool = True) -> None:
+        self.restart_required = bool(required)
+
+    def start(self, stop_evt: threading.Event) -> None:
+        """Poll Wi-Fi and the local IP on a background thread so snapshot() never blocks."""
+        if self._poller is not None:
+            return
+        self._poller = threading.Thread(
+            target=self._poll_loop, args=(stop_evt,), name="StatusPoller", daemon=True
+        )
+        self._poller.start()
+
+    def _poll_loop(self, stop_evt: threading.Event) -> None:
+        while not stop_evt.is_set():
+            was_connected = self._wifi_cached[0]
+            self._refresh_wifi()
+            if self.web_port:
+                now = time.monotonic()
+                if (
+                    not self._ip_cached
+                    or self._wifi_cached[0] != was_connected
+                    or now - self._last_ip_check > IP_REFRESH_S
+                ):
+                    self._refresh_ip()
+                    self._last_ip_check = now
+            stop_evt.wait(WIFI_POLL_S)
+
+    def _refresh_ip(self) -> None:
+        try:
+            self._ip_cached = self._get_local_ip()
+        except Exception:
+            self._ip_cached = ""
+
+    def _refresh_wifi(self) -> None:
+        try:
+            self._wifi_cached = self._read_wifi()
+        except Exception:
+            # Cache empty result if wifi status cannot be read
+            self._wifi_cached = (False, "")
 
     def snapshot(self) -> Dict[str, Any]:
-        now = time.time()
-        if now - self._last_wifi_check > 2:
-            try:
-                self._wifi_cached = self._read_wifi()
-            except Exception:
-                # Cache empty result if wifi status cannot be read
-                self._wifi_cached = (False, "")
+        now = time.monotonic()
+        # Without a poller (e.g. tests), fall back to polling inline
+        if self._poller is None and now - self._last_wifi_check > WIFI_POLL_S:
+            self._refresh_wifi()
             self._last_wifi_check = now
         connected, ssid = self._wifi_cached
+        restart = self.restart_required
 
-        bar_right: List[Tuple[str, Optional[str]]] = []
+        # Icons only change when one of these flags flips; reuse the list
+        state = (connected, restart)
+        if state != self._bar_state:
+            bar_right: List[Tuple[str, Optional[str]]] = []
 
-        wifi_icon = "📶"
-        if connected:
-            bar_right.append((wifi_icon, None))
-        else:
-            bar_right.append((wifi_icon, "#606060"))
+            wifi_icon = "📶"
+            if connected:
+                bar_right.append((wifi_icon, None))
+            else:
+                bar_right.append((wifi_icon, "#606060"))
 
-        if self.settings.get("system", {}).get("restart_required"):
-            bar_right.append(("↻", None))
+            if restart:
+                bar_right.append(("↻", None))
+
+            self._bar_right = bar_right
+            self._bar_state = state
 
         footer = ""
         if self.web_port:
-            if now - self._last_ip_check > 60 or not self._ip_cached:
-                try:
-                    self._ip_cached = self._get_local_ip()
-                except Exception:
-                    self._ip_cached = ""
+            if self._poller is None and (
+                now - self._last_ip_check > IP_REFRESH_S or not self._ip_cached
+            ):
+                self._refresh_ip()
                 self._last_ip_check = now
             if self._ip_cached:
                 footer = f"http://{self._ip_cached}:{self.web_port}"
 
-        return {
-            "time": time.strftime("%H:%M"),
-            "wifi": bar_right,
-            "footer": footer,
-        }
+        wall = time.time()
+        minute = int(wall) // 60
+        if minute != self._last_min:
+            self._time_str = time.strftime("%H:%M", time.localtime(wall))
+            self._last_min = minute
+
+        # Hand back the same dict until something visible changes
+        key = (self._bar_state, self._time_str, footer)
+        if key != self._snap_key:
+            self._snap = {
+                "time": self._time_str,
+                "wifi": self._bar_right,
+                "footer": footer,
+            }
+            self._snap_key = key
+        return self._snap
 
     def _get_local_ip(self) -> str:
         """Best-effort local IP address for constructing a URL."""
@@ -64,10 +193,29 @@ class StatusProvider:
     def _read_wifi(self) -> Tuple[bool, str]:
         """Read Wi-Fi status from the operating system.
 
+        Uses ``/proc/net/wireless`` and an ioctl where available, falling
+        back to ``nmcli``/``iwconfig`` subprocesses otherwise.
+
         Returns:
             Tuple[bool, str]: ``(connected, ssid)``
         """
 
+        link = _read_proc_wireless(PROC_NET_WIRELESS)
+        if link is not None:
+            iface, quality = link
+            if not iface or quality <= 0:
+                return False, ""
+            now = time.monotonic()
+            c_iface, ssid, ts = self._ssid_cached
+            if c_iface != iface or ssid is None or now - ts > SSID_REFRESH_S:
+                ssid = _ioctl_essid(iface)
+                self._ssid_cached = (iface, ssid, now)
+            if ssid:
+                return True, ssid
+
+        return self._read_wifi_subprocess()
+
+    def _read_wifi_subprocess(self) -> Tuple[bool, str]:
         # Try NetworkManager first
         try:
             nmcli_out = subprocess.check_output(
@@ -85,12 +233,11 @@ class StatusProvider:
         try:
             iwconfig_out = subprocess.check_output(
                 ["iwconfig"], stderr=subprocess.DEVNULL
-            ).decode()
-            for line in iwconfig_out.splitlines():
-                if "ESSID:" in line:
-                    essid = line.split("ESSID:", 1)[1].strip().strip('"')
-                    if essid and essid.lower() != "off/any":
-                        return True, essid
+            )
+            for m in _ESSID_RE.finditer(iwconfig_out):
+                essid = m.group(1).decode(errors="replace")
+                if essid.lower() != "off/any":
+                    return True, essid
             return False, ""
         except Exception:
             return False, ""
@@ -1,27 +1,56 @@
 # app/storage.py
 import json, os, tempfile, shutil
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+try:  # optional C-accelerated JSON; stdlib json is the fallback
+    import orjson
+except Exception:  # pragma: no cover - orjson may not be installed
+    orjson = None  # type: ignore[assignment]
+
+def loads_json(buf: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
 
 def load_json(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-            return _merge(default, data)
+        with open(path, "rb") as f:
+            data = loads_json(f.read())
+        return _merge(default, data)
     except Exception:
         # write defaults if file missing/bad
         save_json_atomic(path, default)
         return default.copy()
 
-def save_json_atomic(path: str, data: Dict[str, Any]) -> None:
+def dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def save_json_atomic(
+    path: str, data: Dict[str, Any], durable: bool = False, keep_backup: bool = False
+) -> None:
+    save_bytes_atomic(path, dump_json_bytes(data), durable=durable, keep_backup=keep_backup)
+
+def save_bytes_atomic(
+    path: str, buf: bytes, durable: bool = False, keep_backup: bool = False
+) -> None:
+    """Atomically replace ``path`` with ``buf`` (write temp file + rename).
+
+    The rename alone keeps readers from ever seeing a torn file. ``durable``
+    additionally fsyncs the data before the rename (survives power loss);
+    ``keep_backup`` copies the previous file to ``path + ".bak"`` first.
+    """
     d = os.path.dirname(path) or "."
     os.makedirs(d, exist_ok=True)
-    tmp = tempfile.NamedTemporaryFile("w", delete=False, dir=d)
+    tmp = tempfile.NamedTemporaryFile("wb", delete=False, dir=d)
     try:
-        json.dump(data, tmp, indent=2)
-        tmp.flush(); os.fsync(tmp.fileno())
+        tmp.write(buf)
+        if durable:
+            tmp.flush(); os.fsync(tmp.fileno())
         tmp.close()
         # backup old file
-        if os.path.exists(path):
+        if keep_backup and os.path.exists(path):
             shutil.copy2(path, path + ".bak")
         os.replace(tmp.name, path)
     finally:
@@ -31,8 +60,10 @@ def save_json_atomic(path: str, data: Dict[str, Any]) -> None:
 def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     out = base.copy()
     for k,v in override.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _merge(out[k], v)
+        bv = out.get(k)
+        if isinstance(v, dict) and isinstance(bv, dict):
+            # Subtrees without overrides only need the shallow copy
+            out[k] = _merge(bv, v) if v else bv.copy()
         else:
             out[k] = v
     return out
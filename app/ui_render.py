@@ -1,64 +1,95 @@
 # app/ui_render.py
+import functools
 from typing import Dict, Any
 from PIL import Image, ImageDraw, ImageFont
 
+@functools.lru_cache(maxsize=16)
 def load_font(size=20):
+    # Cached per size: parsing the TTF on every frame dominated render time
     try:
         return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", size)
     except Exception:
         return ImageFont.load_default()
 
+@functools.lru_cache(maxsize=1)
+def _measure_draw():
+    # Scratch surface used only for text measurement
+    return ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+@functools.lru_cache(maxsize=512)
+def _textlen(txt, font):
+    # Menu labels, values and icons repeat every frame; measure each once
+    return _measure_draw().textlength(txt, font=font)
+
+@functools.lru_cache(maxsize=32)
+def _status_layout(items, W, font):
+    """Right-aligned (txt, color, x) placements for the status-bar icons."""
+    out = []
+    x = W - 6
+    for txt, col in reversed(items):
+        x -= _textlen(txt, font)
+        out.append((txt, col, x))
+        x -= 6
+    return tuple(out)
+
 def render_menu(canvas, view, status, theme):
     W, H = canvas.size
-    d = ImageDraw.Draw(canvas)
     fg = theme.get("fg", "white")
     bg = theme.get("bg", "black")
     accent = theme.get("accent", "cyan")
 
-    d.rectangle((0, 0, W, H), fill=bg)
+    # Everything below the status bar only depends on the view, footer and
+    # theme; focus moves flip between a handful of these layers
+    items = view.get("items", ())
+    focus_idx = view.get("focus_idx")
+    if focus_idx is None:
+        focus_idx = next((i for i, it in enumerate(items) if it.focused), 0)
+    canvas.paste(_menu_layer((W, H), view.get("title", ""), items, focus_idx,
+                             status.get("footer", ""), fg, bg, accent))
 
+    d = ImageDraw.Draw(canvas)
     font_small = load_font(14)
     bar_h = 20
     d.rectangle((0, 0, W, bar_h), fill="#101010")
     d.text((6, 2), status.get("time", ""), fill=fg, font=font_small)
     right_info = status.get("wifi", "")
     if isinstance(right_info, str):
-        items = [(right_info, fg)] if right_info else []
+        items = ((right_info, fg),) if right_info else ()
     else:
-        items = [(txt, col or fg) for txt, col in right_info]
-    x = W - 6
-    for txt, col in reversed(items):
-        tw = d.textlength(txt, font=font_small)
-        x -= tw
+        items = tuple((txt, col or fg) for txt, col in right_info)
+    for txt, col, x in _status_layout(items, W, font_small):
         d.text((x, 2), txt, fill=col, font=font_small)
-        x -= 6
     d.line((0, bar_h, W, bar_h), fill="#404040")
 
+@functools.lru_cache(maxsize=16)
+def _menu_layer(size, title, items, focus_idx, footer, fg, bg, accent):
+    """Background, title, rows and footer; the status bar is drawn over it."""
+    W, H = size
+    layer = Image.new("RGB", size, bg)
+    d = ImageDraw.Draw(layer)
+    bar_h = 20
+
     font_title = load_font(20)
-    d.text((8, bar_h + 6), view.get("title",""), fill=accent, font=font_title)
+    d.text((8, bar_h + 6), title, fill=accent, font=font_title)
 
     font_row = load_font(18)
-    font_row_stub = load_font(18)  # same face; use a dimmer color
     row_y = bar_h + 34
     row_h = 26
     padding = 8
 
-    footer = status.get("footer", "")
     footer_h = 18 if footer else 0
 
     # Determine how many rows fit on the screen and which slice of items to draw
-    items = view.get("items", [])
     max_rows = max(1, (H - footer_h - row_y) // row_h)
-    focus_idx = next((i for i, it in enumerate(items) if it.get("focused")), 0)
     top_idx = max(0, min(focus_idx - max_rows + 1, len(items) - max_rows))
     visible = items[top_idx : top_idx + max_rows]
 
     for item in visible:
-        label = item.get("label","")
-        value = item.get("value","")
-        focused = item.get("focused", False)
-        live = item.get("live", True)
-        needs_restart = item.get("restart", False)
+        label = item.label
+        value = item.value
+        focused = item.focused
+        live = item.live
+        needs_restart = item.restart
 
         if not live:
             label_disp = f"{label} (stub)"
@@ -76,13 +107,13 @@ def render_menu(canvas, view, status, theme):
 
         d.text((padding + 6, row_y), label_disp, fill=color, font=font_row)
         if value:
-            tw = d.textlength(value, font=font_row)
+            tw = _textlen(value, font_row)
             d.text((W - padding - 6 - tw, row_y), value, fill=color, font=font_row)
         row_y += row_h
 
     if footer:
         d.line((0, H - footer_h, W, H - footer_h), fill="#404040")
         font_footer = load_font(14)
-        tw = d.textlength(footer, font=font_footer)
+        tw = _textlen(footer, font_footer)
         d.text(((W - tw) // 2, H - footer_h + 2), footer, fill=fg, font=font_footer)
-
+    return layer
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import gzip
+import hashlib
+import logging
+import struct
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
-from urllib.parse import urlparse  # <-- important
+
+import numpy as np
 
 try:  # pragma: no cover - optional dependency
     import websockets
@@ -15,6 +20,47 @@ except Exception:  # pragma: no cover
     websockets = None  # type: ignore[assignment]
 
 from app.animation_controller import AnimationControllerThread
+from app.storage import loads_json
+
+
+# Binary preview messages: <u8 type><u16 w><u16 h><u32 count> then records
+_MSG_HDR = struct.Struct("<BHHI")
+MSG_RAW = 0    # count pixels of r, g, b
+MSG_DELTA = 1  # count records of <u16 index> r, g, b
+MSG_RLE = 2    # count records of <u8 run> r, g, b; runs never cross rows
+_DELTA_REC = np.dtype([("i", "<u2"), ("rgb", "u1", (3,))])
+_RLE_REC = np.dtype([("n", "u1"), ("rgb", "u1", (3,))])
+
+# Upper bound on preview messages per second, whatever the animation does
+MAX_PREVIEW_FPS = 20.0
+# A viewer with more than this many bytes still unsent skips frames
+_MAX_CLIENT_BACKLOG = 64 * 1024
+
+
+def _write_backlog(ws: Any) -> int:
+    transport = getattr(ws, "transport", None)
+    try:
+        return transport.get_write_buffer_size()
+    except AttributeError:
+        return 0
+
+
+def _parse_points(pts: Any) -> np.ndarray:
+    """``(n, 5)`` int array of x, y, r, g, b from ``[{x,y,r,g,b}, ...]``.
+
+    Malformed points (missing keys, non-numeric or absurd values) are
+    skipped one by one so they never cost the rest of the batch.
+    """
+    rows = []
+    for p in pts:
+        try:
+            x, y = int(p["x"]), int(p["y"])
+            rgb = (int(p["r"]) & 0xFF, int(p["g"]) & 0xFF, int(p["b"]) & 0xFF)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            continue
+        if 0 <= x < 1 << 16 and 0 <= y < 1 << 16:
+            rows.append((x, y) + rgb)
+    return np.array(rows, dtype=np.int64).reshape(-1, 5)
 
 
 HOME_PAGE = """<!doctype html>
@@ -70,7 +116,8 @@ const WS_PORT = {WS_PORT};
 const LED_W = {LED_W};
 const LED_H = {LED_H};
 
-let ws, drawing=false, sendQueue=[], lastSent=0;
+// Pending points keyed by LED index: a drag revisits the same cell many times per frame
+let ws, drawing=false, sendQueue=new Map(), lastSent=0;
 
 function hexToRgb(hex){
   const x=hex.replace('#','');
@@ -93,8 +140,7 @@ function setupCanvas(canvas){
   return ctx;
 }
 
-function canvasToLed(canvas, clientX, clientY){
-  const rect = canvas.getBoundingClientRect();
+function canvasToLed(rect, clientX, clientY){
   const nx = (clientX - rect.left) / rect.width;   // 0..1
   const ny = (clientY - rect.top)  / rect.height;  // 0..1
   let ix = Math.min(LED_W-1, Math.max(0, Math.floor(nx * LED_W)));
@@ -115,6 +161,7 @@ function init(){
   const padCtx = setupCanvas(pad);
 
   ws = new WebSocket(`ws://${location.hostname}:${WS_PORT}`);
+  ws.binaryType = 'arraybuffer';
   ws.addEventListener('open', ()=>console.log('ws open'));
   ws.addEventListener('close', ()=>console.log('ws closed'));
 
@@ -130,8 +177,8 @@ function init(){
     const rgb = hexToRgb(colorEl.value);
     const rect = pad.getBoundingClientRect();
     for (const e of events){
-      const [ix, iy] = canvasToLed(pad, e.clientX, e.clientY);
-      sendQueue.push({x:ix, y:iy, r:rgb[0], g:rgb[1], b:rgb[2]});
+      const [ix, iy] = canvasToLed(rect, e.clientX, e.clientY);
+      sendQueue.set(iy*LED_W + ix, {x:ix, y:iy, r:rgb[0], g:rgb[1], b:rgb[2]});
       drawDot(e.clientX - rect.left, e.clientY - rect.top, colorEl.value);
     }
   }
@@ -143,8 +190,8 @@ function init(){
 
   // Batch-send ~50 FPS
   function tick(ts){
-    if (ws && ws.readyState===1 && sendQueue.length && (!lastSent || ts - lastSent > 20)){
-      const pts = sendQueue; sendQueue = []; lastSent = ts;
+    if (ws && ws.readyState===1 && sendQueue.size && (!lastSent || ts - lastSent > 20)){
+      const pts = Array.from(sendQueue.values()); sendQueue.clear(); lastSent = ts;
       ws.send(JSON.stringify({type:"points", pts}));
     }
     requestAnimationFrame(tick);
@@ -156,6 +203,7 @@ function init(){
     // wipe local pad & preview
     padCtx.fillStyle = '#111'; padCtx.fillRect(0,0,pad.clientWidth,pad.clientHeight);
     pctx.clearRect(0,0,preview.width,preview.height);
+    if (img) img.data.fill(0);
   });
 
   drawBtn.addEventListener('click', ()=>{
@@ -170,32 +218,44 @@ function init(){
   }
   ensurePreviewSize();
 
+  // Binary messages: <u8 type><u16 w><u16 h><u32 count> then `count` records
+  //   0 raw:   r,g,b per pixel
+  //   1 delta: <u16 index> r,g,b
+  //   2 rle:   <u8 run> r,g,b (runs follow each other in row-major order)
+  // One RGBA buffer mirrors the matrix; each message patches it in place
+  // and is shown with a single putImageData
+  let img = null;
+  function frameData(w, h){
+    if (!img || img.width !== w || img.height !== h) img = pctx.createImageData(w, h);
+    return img.data;
+  }
+
   ws.onmessage = (e)=>{
-    const msg = JSON.parse(e.data);
-    if (msg.type === 'frame_rle'){
-      let idx = 0;
-      for (const row of msg.rows){
-        for (const run of row){
-          const count = run[0]; const rgb = run[1];
-          for (let k=0;k<count;k++){
-            const x = idx % LED_W;
-            const y = Math.floor(idx / LED_W);
-            pctx.fillStyle = `rgb(${rgb[0]},${rgb[1]},${rgb[2]})`;
-            pctx.fillRect(x, y, 1, 1);
-            idx++;
-          }
-        }
+    const dv = new DataView(e.data);
+    const type = dv.getUint8(0);
+    const w = dv.getUint16(1, true), h = dv.getUint16(3, true), n = dv.getUint32(5, true);
+    const b = new Uint8Array(e.data, 9);
+    const u8 = frameData(w, h);
+    if (type === 0){
+      for (let i=0, o=0, p=0; i<n; i++, o+=3, p+=4){
+        u8[p] = b[o]; u8[p+1] = b[o+1]; u8[p+2] = b[o+2]; u8[p+3] = 255;
+      }
+    } else if (type === 1){
+      for (let j=0, o=0; j<n; j++, o+=5){
+        const p = (b[o] | (b[o+1] << 8)) * 4;
+        u8[p] = b[o+2]; u8[p+1] = b[o+3]; u8[p+2] = b[o+4]; u8[p+3] = 255;
       }
-    } else if (msg.type === 'delta'){
-      const idxs = msg.indices, rgbs = msg.rgb;
-      for (let j=0;j<idxs.length;j++){
-        const i = idxs[j], c = rgbs[j];
-        const x = i % LED_W;
-        const y = Math.floor(i / LED_W);
-        pctx.fillStyle = `rgb(${c[0]},${c[1]},${c[2]})`;
-        pctx.fillRect(x, y, 1, 1);
+    } else if (type === 2){
+      for (let j=0, o=0, p=0; j<n; j++, o+=4){
+        const r = b[o+1], g = b[o+2], bl = b[o+3];
+        for (let k=0; k<b[o]; k++, p+=4){
+          u8[p] = r; u8[p+1] = g; u8[p+2] = bl; u8[p+3] = 255;
+        }
       }
+    } else {
+      return;
     }
+    pctx.putImageData(img, 0, 0);
   };
 }
 
@@ -223,45 +283,83 @@ window.onload = init;
 </html>"""
 
 
+def _encode_page(html: str) -> tuple[bytes, bytes]:
+    """Return the UTF-8 body and its gzipped form."""
+    raw = html.encode("utf-8")
+    return raw, gzip.compress(raw, 9)
+
+
+_HOME_BYTES, _HOME_GZ = _encode_page(HOME_PAGE)
+_HOME_ETAG = '"' + hashlib.sha1(_HOME_BYTES).hexdigest() + '"'
+
+
 class _Handler(BaseHTTPRequestHandler):
     """Handle basic routing for pages and actions."""
 
+    # Buffer wfile so status line, headers and body leave in one send() when
+    # the request is flushed; with a single write per response Nagle only adds delay
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    # Keep connections open between button presses; every response carries a
+    # Content-Length, and idle connections are dropped after `timeout` seconds
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
     def do_GET(self) -> None:  # pragma: no cover
-        # Normalize the path (strip querystring/fragments) to avoid 404s like /start?x=1
-        path = urlparse(self.path).path
+        # Drop the query string and trailing slash so /start?x=1 and /draw/ still match
+        path = self.path.partition("?")[0].rstrip("/") or "/"
+        route = self.ROUTES.get(path)
+        if route is None:
+            self.send_error(404, "Not found")
+        else:
+            route(self)
 
-        # Quietly ignore favicon lookups
-        if path == "/favicon.ico":
-            self.send_response(204)
-            self.end_headers()
-            return
+    def _home(self) -> None:
+        self._send_html(_HOME_BYTES, _HOME_GZ, _HOME_ETAG)
 
-        if path.rstrip("/") == "/start":
-            self.server.anim_thread.set_mode("test")  # type: ignore[attr-defined]
-            self._redirect("/")
-        elif path.rstrip("/") == "/stop":
-            self.server.anim_thread.set_mode("idle")  # type: ignore[attr-defined]
-            self._redirect("/")
-        elif path.rstrip("/") == "/draw_mode":
-            self.server.anim_thread.set_mode("draw")  # type: ignore[attr-defined]
-            self.send_response(204)
-            self.end_headers()
-        elif path.rstrip("/") == "/draw":
-            # Determine matrix size for the pad/preview
-            w = h = 16
-            try:
-                _buf, w, h = self.server.anim_thread.framebuffer_rgb_bytes()  # type: ignore[attr-defined]
-            except Exception:
-                pass
+    def _start(self) -> None:
+        self.server.anim_thread.set_mode("test")  # type: ignore[attr-defined]
+        self._redirect("/")
+
+    def _stop(self) -> None:
+        self.server.anim_thread.set_mode("idle")  # type: ignore[attr-defined]
+        self._redirect("/")
+
+    def _draw_mode(self) -> None:
+        self.server.anim_thread.set_mode("draw")  # type: ignore[attr-defined]
+        self._no_content()
+
+    def _draw(self) -> None:
+        # Determine matrix size for the pad/preview
+        w = h = 16
+        try:
+            _buf, w, h = self.server.anim_thread.framebuffer_rgb_bytes()  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        # The page only depends on the matrix size (and the fixed WS port)
+        cache = self.server.draw_cache  # type: ignore[attr-defined]
+        page = cache.get((w, h))
+        if page is None:
             html = (DRAW_PAGE
                     .replace("{WS_PORT}", str(self.server.ws_port))      # type: ignore[attr-defined]
                     .replace("{LED_W}", str(w))
                     .replace("{LED_H}", str(h)))
-            self._send_html(html)
-        elif path == "/":
-            self._send_html(HOME_PAGE)
-        else:
-            self.send_error(404, "Not found")
+            page = cache[(w, h)] = _encode_page(html)
+        self._send_html(*page)
+
+    def _no_content(self) -> None:
+        # Also used to quietly answer favicon lookups
+        self.send_response(204)
+        self.end_headers()
+
+    ROUTES = {
+        "/": _home,
+        "/start": _start,
+        "/stop": _stop,
+        "/draw_mode": _draw_mode,
+        "/draw": _draw,
+        "/favicon.ico": _no_content,
+    }
 
     def log_message(self, format: str, *args: Any) -> None:  # pragma: no cover
         return
@@ -269,12 +367,25 @@ class _Handler(BaseHTTPRequestHandler):
     def _redirect(self, location: str) -> None:
         self.send_response(303)
         self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
-    def _send_html(self, html: str) -> None:
-        data = html.encode("utf-8")
+    def _send_html(self, data: bytes, gz: bytes | None = None, etag: str | None = None) -> None:
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "public, max-age=3600")
+        if gz is not None:
+            self.send_header("Vary", "Accept-Encoding")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self.send_header("Content-Encoding", "gzip")
+                data = gz
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
@@ -296,10 +407,12 @@ class WebServerThread(threading.Thread):
         self.host = host
         self.port = port
         self.ws_port = port + 1
-        self.httpd = HTTPServer((host, port), _Handler)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
         self.httpd.anim_thread = anim_thread  # type: ignore[attr-defined]
         self.httpd.ws_port = self.ws_port  # type: ignore[attr-defined]
-        self.httpd.timeout = 0.5
+        # (w, h) -> encoded /draw page and its gzipped form
+        self.httpd.draw_cache = {}  # type: ignore[attr-defined]
 
         self.loop = asyncio.new_event_loop()
         if websockets:
@@ -312,94 +425,197 @@ class WebServerThread(threading.Thread):
         self._last_buf: bytes = b""
         self._last_w: int = 0
         self._last_h: int = 0
-        self._fps = 20.0
+        self._max_fps = MAX_PREVIEW_FPS
+        self._last_send_ts = float("-inf")
+        # Viewers that skipped a frame and need a full frame before more deltas
+        self._stale: set[Any] = set()
+        # Work arrays reused across ticks; sized by _ensure_scratch
+        self._scratch_npx = 0
+        # Frames are encoded off the event loop so WS receives and sends keep
+        # flowing; one worker keeps the scratch arrays single-threaded
+        self._enc_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PreviewEnc")
+        # Set (via the loop) when the framebuffer changes; _frame_pending keeps
+        # a burst of pixel writes from queueing one wakeup each
+        self._frame_evt = asyncio.Event()
+        self._frame_pending = False
 
     # ---------------- Frame diff / compression helpers ----------------
-    def _delta_indices(self, old: bytes, new: bytes) -> list[int]:
-        if not old or len(old) != len(new):
-            return list(range(len(new) // 3))
-        diffs = []
-        npx = len(new) // 3
-        for i in range(npx):
-            o = i * 3
-            if old[o:o+3] != new[o:o+3]:
-                diffs.append(i)
-        return diffs
-
-    def _encode_rle_rows(self, buf: bytes, w: int, h: int) -> list[list[tuple[int, list[int]]]]:
-        rows = []
-        for y in range(h):
-            row = []
-            start = y * w * 3
-            end = start + w * 3
-            cur = buf[start:start+3]
-            run = 1
-            i = start + 3
-            while i < end:
-                nxt = buf[i:i+3]
-                if nxt == cur and run < 255:
-                    run += 1
-                else:
-                    row.append((run, list(cur)))
-                    cur = nxt
-                    run = 1
-                i += 3
-            row.append((run, list(cur)))
-            rows.append(row)
-        return rows
+    def _ensure_scratch(self, npx: int) -> None:
+        """(Re)allocate the per-frame work arrays when the pixel count changes."""
+        if self._scratch_npx == npx:
+            return
+        self._scratch_npx = npx
+        # Pixels packed as 0x00RRGGBB: this frame and the last one broadcast
+        self._packed = np.empty(npx, dtype=np.uint32)
+        self._last_packed = np.empty(npx, dtype=np.uint32)
+        self._packed_tmp = np.empty(npx, dtype=np.uint32)
+        self._changed = np.empty(npx, dtype=bool)
+        self._run_start = np.empty(npx, dtype=bool)
+        # Run pieces never outnumber pixels, so both record arrays fit npx
+        self._delta_rec = np.empty(npx, dtype=_DELTA_REC)
+        self._rle_rec = np.empty(npx, dtype=_RLE_REC)
+
+    def _pack(self, px: np.ndarray) -> np.ndarray:
+        """Pack ``(N, 3)`` RGB rows into the scratch uint32 array.
+
+        Diffing and run detection both work on this one array, so each
+        tick reads the frame once and compares scalars instead of triples.
+        """
+        self._ensure_scratch(len(px))
+        packed, tmp = self._packed, self._packed_tmp
+        np.left_shift(px[:, 0], 16, out=packed, dtype=np.uint32)
+        np.left_shift(px[:, 1], 8, out=tmp, dtype=np.uint32)
+        packed |= tmp
+        packed |= px[:, 2]
+        return packed
+
+    def _delta_indices(self, packed: np.ndarray) -> np.ndarray:
+        """Indices of pixels that differ from the last broadcast frame."""
+        if len(self._last_buf) != 3 * len(packed):
+            return np.arange(len(packed))
+        np.not_equal(packed, self._last_packed, out=self._changed)
+        return np.flatnonzero(self._changed)
+
+    def _encode_rle(self, packed: np.ndarray, w: int) -> tuple[np.ndarray, np.ndarray]:
+        """Run lengths (each at most 255) and start pixels; runs never cross rows."""
+        # A run starts at every colour change and at the first pixel of each row
+        change = self._run_start
+        change[0] = True
+        np.not_equal(packed[1:], packed[:-1], out=change[1:])
+        change[::w] = True
+        starts = np.flatnonzero(change)
+        counts = np.diff(starts, append=len(packed))
+        if w > 255:
+            # Split long runs into pieces of at most 255 pixels
+            pieces = (counts + 254) // 255
+            run = np.repeat(np.arange(len(starts)), pieces)
+            k = np.arange(len(run)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+            starts = starts[run] + 255 * k
+            counts = np.minimum(255, counts[run] - 255 * k)
+        return counts, starts
+
+    def _encode_frame(self, buf: bytes, w: int, h: int) -> tuple[bytes, bool]:
+        """Encode ``buf`` against the last broadcast frame and make it the new base.
+
+        Returns the message and whether it is a delta (viewers that missed
+        earlier frames cannot apply it).
+        """
+        px = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 3)
+        npx = len(px)
+        packed = self._pack(px)
+        diffs = self._delta_indices(packed)
+        use_delta = (self._last_w == w and self._last_h == h and npx <= 0x10000
+                     and 0 < len(diffs) < npx * 0.4)
+        if use_delta:
+            rec = self._delta_rec[:len(diffs)]
+            rec["i"] = diffs
+            np.take(px, diffs, axis=0, out=rec["rgb"])
+            msg = _MSG_HDR.pack(MSG_DELTA, w, h, len(rec)) + rec.tobytes()
+        else:
+            counts, starts = self._encode_rle(packed, w)
+            rec = self._rle_rec[:len(counts)]
+            rec["n"] = counts
+            np.take(px, starts, axis=0, out=rec["rgb"])
+            msg = _MSG_HDR.pack(MSG_RLE, w, h, len(rec)) + rec.tobytes()
+            self._last_w, self._last_h = w, h
+        self._last_buf = buf
+        self._packed, self._last_packed = self._last_packed, self._packed
+        return msg, use_delta
+
+    def _snapshot_message(self) -> bytes:
+        """Raw full frame for a new viewer.
+
+        Uses the last broadcast frame when there is one so later deltas line
+        up with what the other viewers already have.
+        """
+        if self._last_buf:
+            buf, w, h = self._last_buf, self._last_w, self._last_h
+        else:
+            buf, w, h = self.anim_thread.framebuffer_rgb_bytes()
+        return _MSG_HDR.pack(MSG_RAW, w, h, w * h) + buf
 
     # ---------------- WebSocket handlers ----------------
+    def _on_frame(self) -> None:
+        """Frame listener; runs on whichever thread changed the framebuffer."""
+        if self._frame_pending:
+            return
+        self._frame_pending = True
+        try:
+            self.loop.call_soon_threadsafe(self._frame_evt.set)
+        except RuntimeError:  # loop already closed during shutdown
+            pass
+
     async def _broadcast_loop(self):
         while not self.stop_evt.is_set():
-            await asyncio.sleep(1.0 / self._fps)
+            await self._frame_evt.wait()
+            # Send right away after a quiet spell; during a burst wait out the
+            # rest of the frame period and then send only the newest frame
+            delay = self._last_send_ts + 1.0 / self._max_fps - self.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._frame_evt.clear()
+            self._frame_pending = False
             if not self.clients:
+                # Nobody saw this change, so the last broadcast frame no longer
+                # matches the panel; let the next viewer snapshot the live
+                # framebuffer (and the next broadcast start with a full frame)
+                self._last_buf = b""
                 continue
             try:
                 buf, w, h = self.anim_thread.framebuffer_rgb_bytes()
             except Exception:
                 continue
-            diffs = self._delta_indices(self._last_buf, buf)
-            npx = len(buf) // 3
-            use_delta = self._last_w == w and self._last_h == h and 0 < len(diffs) < npx * 0.4
-            if use_delta:
-                indices = diffs
-                rgb = []
-                for i in indices:
-                    o = i * 3
-                    rgb.append([buf[o], buf[o+1], buf[o+2]])
-                payload = {"type": "delta", "w": w, "h": h, "indices": indices, "rgb": rgb}
-                msg = json.dumps(payload)
+            # Writes that left the frame as it was (e.g. repainting the same
+            # colour) need neither encoding nor a send; bytes == is a memcmp
+            if w == self._last_w and h == self._last_h and buf == self._last_buf:
+                continue
+            msg, is_delta = await self.loop.run_in_executor(
+                self._enc_pool, self._encode_frame, buf, w, h
+            )
+            self._last_send_ts = self.loop.time()
+            resync = _MSG_HDR.pack(MSG_RAW, w, h, w * h) + buf if is_delta and self._stale else None
+            await self._broadcast(msg, resync)
+
+    async def _broadcast(self, msg: bytes, resync: bytes | None = None) -> None:
+        """Send ``msg`` to every viewer concurrently, dropping failed ones.
+
+        Viewers whose socket is backed up skip the frame rather than stall
+        the others, and are marked stale; once drained they get ``resync``
+        (a full frame) in place of a delta against a frame they never saw.
+        """
+        clients, msgs = [], []
+        for ws in list(self.clients):
+            if _write_backlog(ws) > _MAX_CLIENT_BACKLOG:
+                self._stale.add(ws)
+                continue
+            if ws in self._stale:
+                self._stale.discard(ws)
+                clients.append(ws)
+                msgs.append(resync or msg)
             else:
-                rle = self._encode_rle_rows(buf, w, h)
-                payload = {"type": "frame_rle", "w": w, "h": h, "rows": rle}
-                msg = json.dumps(payload)
-                self._last_w, self._last_h = w, h
-            self._last_buf = buf
-            dead = []
-            for ws in list(self.clients):
-                try:
-                    await ws.send(msg)
-                except Exception:
-                    dead.append(ws)
-            for ws in dead:
+                clients.append(ws)
+                msgs.append(msg)
+        results = await asyncio.gather(*(ws.send(m) for ws, m in zip(clients, msgs)),
+                                       return_exceptions=True)
+        for ws, res in zip(clients, results):
+            if isinstance(res, Exception):
                 self.clients.discard(ws)
 
     async def _ws_handler(self, websocket: Any, path: str) -> None:
-        # If needed by your AnimationControllerThread, it can still push messages via this 'send'
-        send = lambda msg: asyncio.run_coroutine_threadsafe(websocket.send(msg), self.loop)
-        self.anim_thread.register_client(send)
+        # Viewers only join the shared set; _broadcast_loop encodes each frame
+        # once and sends the same message to all of them
         self.clients.add(websocket)
         try:
+            await websocket.send(self._snapshot_message())
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = loads_json(message)
                     t = data.get("type")
                     if t == "points":
                         # Batch of points: [{x,y,r,g,b}, ...]
-                        pts = data.get("pts", [])
-                        for p in pts:
-                            self.anim_thread.update_pixel(int(p["x"]), int(p["y"]),
-                                                          (int(p["r"]), int(p["g"]), int(p["b"])))
+                        arr = _parse_points(data.get("pts") or ())
+                        if len(arr):
+                            self.anim_thread.update_pixels(arr[:, 0], arr[:, 1], arr[:, 2:5])
                         if hasattr(self.anim_thread, "flush"):
                             self.anim_thread.flush()  # optional
                     elif t == "clear":
@@ -409,9 +625,8 @@ class WebServerThread(threading.Thread):
                             # Fallback: paint black across the matrix if size is known
                             try:
                                 _buf, w, h = self.anim_thread.framebuffer_rgb_bytes()
-                                for yy in range(h):
-                                    for xx in range(w):
-                                        self.anim_thread.update_pixel(xx, yy, (0,0,0))
+                                ys, xs = np.divmod(np.arange(w * h), w)
+                                self.anim_thread.update_pixels(xs, ys, np.zeros((w * h, 3), np.uint8))
                                 if hasattr(self.anim_thread, "flush"):
                                     self.anim_thread.flush()
                             except Exception:
@@ -427,24 +642,35 @@ class WebServerThread(threading.Thread):
                 except Exception:
                     continue
         finally:
-            self.anim_thread.unregister_client(send)
             self.clients.discard(websocket)
+            self._stale.discard(websocket)
 
     # ---------------- Run loop ----------------
+    async def _serve(self) -> None:
+        ws = await self.ws_server
+        bcast = asyncio.create_task(self._broadcast_loop())
+        self.anim_thread.add_frame_listener(self._on_frame)
+        try:
+            # Park on the stop event off-loop so the selector only wakes for I/O.
+            await self.loop.run_in_executor(None, self.stop_evt.wait)
+        finally:
+            self.anim_thread.remove_frame_listener(self._on_frame)
+            bcast.cancel()
+            self._enc_pool.shutdown(wait=False)
+            ws.close()
+            await ws.wait_closed()
+
     def run(self) -> None:  # pragma: no cover
-        ws = None
+        http = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        http.start()
+        logging.info("[Web] server listening on %s:%s", self.host, self.port)
         if websockets and self.ws_server:
             asyncio.set_event_loop(self.loop)
-            ws = self.loop.run_until_complete(self.ws_server)
-            self.loop.create_task(self._broadcast_loop())
-        print(f"[Web] server listening on {self.host}:{self.port}")
-        while not self.stop_evt.is_set():
-            self.httpd.handle_request()
-            if websockets and self.ws_server:
-                self.loop.run_until_complete(asyncio.sleep(0.05))
-        self.httpd.server_close()
-        if ws:
-            ws.close()
-            self.loop.run_until_complete(ws.wait_closed())
+            self.loop.run_until_complete(self._serve())
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
             self.loop.close()
-        print("[Web] server stopped")
+        else:
+            self.stop_evt.wait()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        logging.info("[Web] server stopped")
@@ -122,56 +122,51 @@ class LCD_2inch(lcdconfig.RaspberryPi):
         self.command(0x2A)
         self.data(Xstart>>8)        #Set the horizontal starting point to the high octet
         self.data(Xstart & 0xff)    #Set the horizontal starting point to the low octet
-        self.data(Xend>>8)          #Set the horizontal end to the high octet
+        self.data((Xend - 1)>>8)    #Set the horizontal end to the high octet
         self.data((Xend - 1) & 0xff)#Set the horizontal end to the low octet 
 
         #set the Y coordinates
         self.command(0x2B)
         self.data(Ystart>>8)
         self.data((Ystart & 0xff))
-        self.data(Yend>>8)
+        self.data((Yend - 1)>>8)
         self.data((Yend - 1) & 0xff )
 
         self.command(0x2C)    
         
-    def ShowImage(self,Image,Xstart=0,Ystart=0):
+    def rgb565(self, img):
+        """Pack an RGB888 pixel array into big-endian RGB565 bytes."""
+        rgb = img.astype(self.np.uint16)
+        pix = ((rgb[...,0] & 0xF8) << 8) | ((rgb[...,1] & 0xFC) << 3) | (rgb[...,2] >> 3)
+        return pix.astype('>u2').tobytes()
+
+    def ShowImage(self,Image,Xstart=0,Ystart=0,rows=None):
         """Set buffer to value of Python Imaging Library image."""
         """Write display buffer to physical display"""
+        """rows=(y0, y1) only writes that band of image rows"""
         imwidth, imheight = Image.size
+        y0, y1 = rows if rows else (0, imheight)
+        self.ShowRGB565(self.rgb565(self.np.asarray(Image)[y0:y1]), imwidth, imheight, y0, y1)
+
+    def ShowRGB565(self,pix,imwidth,imheight,y0=0,y1=None):
+        """Write pre-packed RGB565 rows y0..y1 (see rgb565) of an imwidth x imheight frame"""
+        if y1 is None:
+            y1 = imheight
         if imwidth == self.height and imheight ==  self.width:
-            img = self.np.asarray(Image)
-            pix = self.np.zeros((self.width, self.height,2), dtype = self.np.uint8)
-            #RGB888 >> RGB565
-            pix[...,[0]] = self.np.add(self.np.bitwise_and(img[...,[0]],0xF8),self.np.right_shift(img[...,[1]],5))
-            pix[...,[1]] = self.np.add(self.np.bitwise_and(self.np.left_shift(img[...,[1]],3),0xE0), self.np.right_shift(img[...,[2]],3))
-            pix = pix.flatten().tolist()
-            
             self.command(0x36)
             self.data(0x70) 
-            self.SetWindows ( 0, 0, self.height,self.width)
-            self.digital_write(self.DC_PIN,True)
-            for i in range(0,len(pix),4096):
-                self.spi_writebyte(pix[i:i+4096])
-            
+            self.SetWindows ( 0, y0, self.height, y1)
         else :
-            img = self.np.asarray(Image)
-            pix = self.np.zeros((imheight,imwidth , 2), dtype = self.np.uint8)
-            
-            pix[...,[0]] = self.np.add(self.np.bitwise_and(img[...,[0]],0xF8),self.np.right_shift(img[...,[1]],5))
-            pix[...,[1]] = self.np.add(self.np.bitwise_and(self.np.left_shift(img[...,[1]],3),0xE0), self.np.right_shift(img[...,[2]],3))
-
-            pix = pix.flatten().tolist()
-            
             self.command(0x36)
             self.data(0x00) 
-            self.SetWindows ( 0, 0, self.width, self.height)
-            self.digital_write(self.DC_PIN,True)
-            for i in range(0,len(pix),4096):
-                self.spi_writebyte(pix[i:i+4096])		
+            self.SetWindows ( 0, y0, self.width, y1)
+        self.digital_write(self.DC_PIN,True)
+        for i in range(0,len(pix),4096):
+            self.spi_writebyte(pix[i:i+4096])
                 
     def clear(self):
         """Clear contents of image buffer"""
-        _buffer = [0xff]*(self.width * self.height * 2)
+        _buffer = b'\xff'*(self.width * self.height * 2)
         self.SetWindows ( 0, 0, self.height, self.width)
         self.digital_write(self.DC_PIN,True)
         for i in range(0,len(_buffer),4096):
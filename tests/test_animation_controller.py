@@ -0,0 +1,108 @@
+import threading
+import time
+
+from app.animation_controller import AnimationControllerThread
+
+
+class DummyLED:
+    def __init__(self):
+        self.frames = []
+
+    def send_raw_frame(self, payload, brightness=None):
+        self.frames.append(bytes(payload))
+
+
+def make_anim(width=2, height=2):
+    return AnimationControllerThread(
+        stop_evt=threading.Event(), led_thread=DummyLED(), width=width, height=height
+    )
+
+
+def test_framebuffer_rgb_bytes_row_major():
+    anim = make_anim()
+    anim.update_pixel(1, 0, (1, 2, 3))
+    anim.update_pixel(0, 1, (4, 5, 6))
+
+    buf, w, h = anim.framebuffer_rgb_bytes()
+
+    assert (w, h) == (2, 2)
+    assert buf == bytes([0, 0, 0, 1, 2, 3, 4, 5, 6, 0, 0, 0])
+
+
+def test_frame_bytes_grb_swaps_red_and_green():
+    anim = make_anim(width=1, height=1)
+    anim.update_pixel(0, 0, (10, 20, 30))
+
+    assert bytes(anim._frame_bytes_grb()) == bytes([20, 10, 30])
+
+
+def test_update_pixel_ignores_out_of_range_and_masks_channels():
+    anim = make_anim()
+    anim.update_pixel(5, 5, (255, 255, 255))
+    anim.update_pixel(0, 0, (256 + 7, -1, 300))
+
+    buf, _w, _h = anim.framebuffer_rgb_bytes()
+    assert buf[:3] == bytes([7, 255, 300 & 0xFF])
+    assert buf[3:] == bytes(9)
+
+
+def test_clear_panel_blanks_frame():
+    anim = make_anim()
+    anim._test_pattern(0.0)
+    anim.clear_panel()
+
+    buf, _w, _h = anim.framebuffer_rgb_bytes()
+    assert buf == bytes(12)
+
+
+def test_test_pattern_only_redraws_on_step_change():
+    anim = make_anim(width=1, height=1)
+    anim._test_pattern(0.2)
+    anim.update_pixel(0, 0, (9, 9, 9))
+
+    anim._test_pattern(0.7)  # same step: framebuffer untouched
+    assert anim.framebuffer_rgb_bytes()[0] == bytes([9, 9, 9])
+
+    anim._test_pattern(1.1)  # next step: green
+    assert anim.framebuffer_rgb_bytes()[0] == bytes([0, 255, 0])
+
+
+def test_frame_listeners_fire_on_framebuffer_changes():
+    anim = make_anim()
+    calls = []
+    anim.add_frame_listener(lambda: calls.append(1))
+
+    anim.update_pixel(0, 0, (1, 1, 1))
+    anim.update_pixel(9, 9, (1, 1, 1))  # out of range: no change
+    anim.clear_panel()
+
+    assert len(calls) == 2
+
+
+def test_update_pixels_matches_single_pixel_path():
+    bulk, single = make_anim(), make_anim()
+    pts = [(1, 0, (1, 2, 3)), (0, 1, (256 + 7, -1, 300)), (5, 0, (9, 9, 9))]
+
+    bulk.update_pixels([p[0] for p in pts], [p[1] for p in pts], [p[2] for p in pts])
+    for x, y, color in pts:
+        single.update_pixel(x, y, color)
+
+    assert bulk.framebuffer_rgb_bytes() == single.framebuffer_rgb_bytes()
+
+
+def test_preview_only_test_mode_waits_between_ticks():
+    anim = AnimationControllerThread(
+        stop_evt=threading.Event(), led_thread=DummyLED(), width=1, height=1, fps=20.0
+    )
+    anim.send_to_led = False
+    anim.set_mode("test")
+    ticks = []
+    anim._test_pattern = ticks.append
+
+    anim.start()
+    time.sleep(0.3)
+    anim.stop_evt.set()
+    anim.join(timeout=1.0)
+
+    # ~6 ticks at 20 fps; a spinning loop would wake thousands of times
+    assert 0 < len(ticks) <= 15
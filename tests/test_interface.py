@@ -1,10 +1,13 @@
 import os
 import sys
+import threading
 import time
 import types
 import unittest
 from unittest.mock import patch
 
+import numpy as np
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Stub out hardware-dependent modules before importing DisplayThread
@@ -56,11 +59,22 @@ class ApplyBrightnessTest(unittest.TestCase):
     def test_invalid_input_defaults_and_warns(self):
         dt = DisplayThread.__new__(DisplayThread)
         dt.disp = DummyLCD()
+        dt._last_brightness = None
         with self.assertLogs(level='WARNING') as log:
             dt._apply_brightness('oops')
         self.assertEqual(dt.disp.last, 100)
         self.assertTrue(any('Invalid brightness value' in m for m in log.output))
 
+    def test_unchanged_value_skips_driver_write(self):
+        dt = DisplayThread.__new__(DisplayThread)
+        dt.disp = DummyLCD()
+        dt._last_brightness = None
+        writes = []
+        dt.disp.bl_DutyCycle = writes.append
+        for val in (40, 40, "40", 0, 0, 40):
+            dt._apply_brightness(val)
+        self.assertEqual(writes, [40, 0, 40])
+
 
 class RunLoopSleepTest(unittest.TestCase):
     def test_brightness_not_restored_while_sleeping(self):
@@ -96,5 +110,94 @@ class RunLoopSleepTest(unittest.TestCase):
         self.assertEqual(set(calls), {0})
 
 
+class RunLoopRenderSkipTest(unittest.TestCase):
+    def test_unchanged_frame_is_not_redrawn_or_pushed(self):
+        settings = {"display": {"brightness": 50, "sleep_seconds": 0}}
+
+        class DummyStop:
+            def __init__(self):
+                self.calls = 0
+
+            def is_set(self):
+                self.calls += 1
+                return self.calls > 3
+
+        view = {"title": "T", "items": ()}
+        status = {"time": "12:00", "wifi": [], "footer": ""}
+        dt = DisplayThread.__new__(DisplayThread)
+        dt.stop_evt = DummyStop()
+        dt.controller = types.SimpleNamespace(last_input_ts=0, view=lambda: view)
+        dt.status = types.SimpleNamespace(snapshot=lambda: status)
+        dt.get_theme = lambda: {}
+        dt.get_settings = lambda: settings
+        dt.canvas = object()
+        dt._last_render = 0.0
+        dt._screensaver_shown = False
+        dt._frame_key = None
+        dt._screensaver = lambda idle, s: False
+        dt._apply_brightness = lambda val: None
+        dt._stop_spi_worker = lambda: None
+        dt.disp = types.SimpleNamespace(module_exit=lambda: None)
+
+        rendered, presented = [], []
+        dt._present = lambda img: presented.append(img) or True
+        clock = iter(range(10, 100, 10))
+
+        with patch('app.interface.render_menu', lambda *a: rendered.append(a)), \
+                patch('time.monotonic', lambda: next(clock)), \
+                patch('time.sleep', lambda s: None):
+            dt.run()
+
+        self.assertEqual(len(rendered), 1)
+        self.assertEqual(len(presented), 1)
+
+
+class WaitForChangeTest(unittest.TestCase):
+    def test_returns_on_menu_change_and_clears_it(self):
+        dt = DisplayThread.__new__(DisplayThread)
+        dt.controller = types.SimpleNamespace(changed=threading.Event())
+        dt.controller.changed.set()
+
+        start = time.monotonic()
+        dt._wait_for_change(5.0)
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(dt.controller.changed.is_set())
+
+
+class SpiSlotTest(unittest.TestCase):
+    def test_worker_pushes_only_the_latest_pending_frame(self):
+        shown = []
+        dt = DisplayThread.__new__(DisplayThread)
+        dt.disp = types.SimpleNamespace(ShowImage=lambda img, rows=None: shown.append(img))
+        dt._transpose_op = None
+        dt._spi_cv = threading.Condition()
+        dt._spi_frame = None
+        dt._spi_stop = False
+
+        older, newer = np.zeros((2, 2, 3), np.uint8), np.ones((2, 2, 3), np.uint8)
+        dt._present(older)
+        dt._present(newer)
+        dt._spi_thread = threading.Thread(target=dt._spi_worker)
+        dt._spi_thread.start()
+        dt._stop_spi_worker()
+
+        self.assertFalse(dt._spi_thread.is_alive())
+        self.assertEqual(len(shown), 1)
+        self.assertTrue((shown[0] == newer).all())
+
+
+class DirtyRowsTest(unittest.TestCase):
+    def test_band_covers_first_to_last_changed_row(self):
+        last = np.zeros((6, 4, 3), dtype=np.uint8)
+        cur = last.copy()
+        self.assertEqual(DisplayThread._dirty_rows(last, cur), (0, 0))
+        self.assertIsNone(DisplayThread._dirty_rows(None, cur))
+
+        cur[1, 2] = (9, 9, 9)
+        cur[3, 0] = (1, 0, 0)
+        self.assertEqual(DisplayThread._dirty_rows(last, cur), (1, 4))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
+import logging
 import threading
 
-from app.led_controller import LEDThread, build_solid_grb
+from app import led_controller
+from app.led_controller import LEDThread, build_solid_grb, pack_frame, send_frame
 
 
 class DummySerial:
@@ -42,6 +44,27 @@ def test_set_all_sends_frame() -> None:
     assert ser.writes == [expected_hdr + payload]
 
 
+def test_set_all_skips_repeated_fill_until_port_reopens() -> None:
+    ser = DummySerial()
+    thread = LEDThread(
+        stop_evt=threading.Event(),
+        get_settings=lambda: {"led": {"brightness": 20}},
+        width=1,
+        height=1,
+        strips_used=1,
+        ser=ser,
+    )
+
+    thread._set_all((1, 2, 3))
+    thread._set_all((1, 2, 3))
+    assert len(ser.writes) == 1
+
+    thread._close_serial()
+    thread.ser = ser  # reconnected
+    thread._set_all((1, 2, 3))
+    assert len(ser.writes) == 2
+
+
 def test_run_clears_on_start_when_stopped() -> None:
     stop_evt = threading.Event()
     stop_evt.set()
@@ -68,3 +91,105 @@ def test_run_clears_on_start_when_stopped() -> None:
     # When stop is set before run, thread should clear strip once
     assert led.colors == [(0, 0, 0)]
 
+
+def test_pack_frame_reuses_and_grows_buffer() -> None:
+    tx = bytearray(4)
+
+    frame = pack_frame(b"\x01\x02\x03", 50, tx)
+
+    assert bytes(frame) == bytes((0xAB, 0xCD, 0xF1, 0x00, 1, 0, 50, 1, 2, 3))
+    assert frame.obj is tx
+
+
+def test_send_frame_logs_pending_acks_without_blocking(caplog) -> None:
+    class AckSerial(DummySerial):
+        def __init__(self):
+            super().__init__()
+            self.rx = b"ACK\nACK\n"
+
+        @property
+        def in_waiting(self) -> int:
+            return len(self.rx)
+
+        def read(self, n: int) -> bytes:
+            data, self.rx = self.rx[:n], self.rx[n:]
+            return data
+
+        def readline(self) -> bytes:  # pragma: no cover - must not be used
+            raise AssertionError("send_frame must not block on readline")
+
+    ser = AckSerial()
+    with caplog.at_level(logging.INFO):
+        send_frame(ser, b"\x00\x00\x00", 10)
+
+    assert len(ser.writes) == 1
+    assert [r.getMessage() for r in caplog.records] == ["Teensy: ACK", "Teensy: ACK"]
+
+
+def test_send_raw_frame_hands_off_to_running_thread() -> None:
+    class ReadySerial(DummySerial):
+        def write(self, data) -> None:
+            self.writes.append(bytes(data))
+
+        def readline(self) -> bytes:
+            return b"RDY\n"
+
+    stop_evt = threading.Event()
+    ser = ReadySerial()
+    led = LEDThread(
+        stop_evt=stop_evt,
+        get_settings=lambda: {"led": {"brightness": 5}},
+        width=1,
+        height=1,
+        strips_used=1,
+        ser=ser,
+    )
+    led.start()
+    try:
+        led.send_raw_frame(b"\x01\x02\x03")
+        for _ in range(200):
+            if ser.writes:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        stop_evt.set()
+        led.join(timeout=2.0)
+
+    hdr = bytes((0xAB, 0xCD, 0xF1, 0x00, 1, 0, 5))
+    assert ser.writes[0] == hdr + b"\x01\x02\x03"
+
+
+def test_send_frame_keeps_partial_ack_line_for_next_call(caplog) -> None:
+    class ChunkedSerial(DummySerial):
+        def __init__(self):
+            super().__init__()
+            self.chunks = [b"AC", b"K\nRD"]
+
+        @property
+        def in_waiting(self) -> int:
+            return len(self.chunks[0]) if self.chunks else 0
+
+        def read(self, n: int) -> bytes:
+            return self.chunks.pop(0)
+
+    ser = ChunkedSerial()
+    rx = bytearray()
+    with caplog.at_level(logging.INFO):
+        send_frame(ser, b"\x00\x00\x00", 10, rx=rx)
+        assert caplog.records == []
+        send_frame(ser, b"\x00\x00\x00", 10, rx=rx)
+
+    assert [r.getMessage() for r in caplog.records] == ["Teensy: ACK"]
+    assert rx == bytearray(b"RD")
+
+
+def test_unterminated_ack_input_is_capped_and_logged_once(caplog, monkeypatch) -> None:
+    monkeypatch.setattr(led_controller, "_rx_overflow_logged", False)
+    rx = bytearray()
+    with caplog.at_level(logging.INFO):
+        for _ in range(3):
+            rx += b"\xff" * 3000
+            led_controller._log_rx_lines(rx)
+            assert len(rx) <= led_controller._RX_MAX_PENDING
+
+    assert [r.levelname for r in caplog.records] == ["WARNING"]
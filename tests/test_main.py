@@ -0,0 +1,43 @@
+import sys
+import threading
+import types
+
+# app.main pulls in the LCD/GPIO stack; stub only what is missing off-device
+for _name in ("driver", "driver.LCD_2inch", "gpiozero"):
+    sys.modules.setdefault(_name, types.ModuleType(_name))
+sys.modules["driver"].LCD_2inch = sys.modules["driver.LCD_2inch"]
+if not hasattr(sys.modules["gpiozero"], "Button"):
+    sys.modules["gpiozero"].Button = object
+
+from app import main  # noqa: E402
+
+
+def test_close_makes_a_routine_save_durable(tmp_path, monkeypatch):
+    calls = []
+    written = threading.Event()
+
+    def fake_save(path, buf, durable=False, keep_backup=False):
+        calls.append((buf, durable, keep_backup))
+        written.set()
+
+    monkeypatch.setattr(main, "save_bytes_atomic", fake_save)
+    saver = main.DebouncedSaver(str(tmp_path / "settings.json"), delay=0.0)
+
+    saver({"display": {"brightness": 50}})
+    assert written.wait(2.0)
+    saver({"display": {"brightness": 50}})  # same bytes as the routine save
+    saver.close()
+
+    assert [c[1:] for c in calls] == [(False, False), (True, True)]
+    assert calls[0][0] == calls[1][0]
+
+
+def test_close_skips_rewrite_when_nothing_was_saved(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "save_bytes_atomic", lambda *a, **k: calls.append(a))
+    (tmp_path / "settings.json").write_bytes(b"{}")
+
+    saver = main.DebouncedSaver(str(tmp_path / "settings.json"), delay=0.0)
+    saver.close()
+
+    assert calls == []
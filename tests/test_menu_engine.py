@@ -45,3 +45,60 @@ def test_led_brightness_rotates():
     for expected in [40, 60, 80, 100, 0, 20]:
         mc.on_event("SELECT")
         assert settings["led"]["brightness"] == expected
+
+
+def test_view_is_cached_until_next_event():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    with open(os.path.join(root, 'menu.json')) as f:
+        menu_spec = json.load(f)
+
+    mc = MenuController(menu_spec, {}, lambda s: None)
+
+    first = mc.view()
+    assert mc.view() is first
+    assert not mc.changed.is_set()
+
+    mc.on_event("DOWN")
+    assert mc.changed.is_set()
+    second = mc.view()
+    assert second is not first
+    assert second["items"][1].focused
+
+
+def test_view_built_during_an_event_is_not_kept():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    with open(os.path.join(root, 'menu.json')) as f:
+        menu_spec = json.load(f)
+
+    mc = MenuController(menu_spec, {}, lambda s: None)
+
+    def move_after_render(items, delta):
+        mc.view()  # display thread renders while the handler runs
+        MenuController._move(mc, items, delta)
+
+    mc._move = move_after_render
+    mc.on_event("DOWN")
+
+    assert mc.view()["focus_idx"] == mc.focus_idx == 1
+
+
+def test_restart_binding_notifies_restart_cb():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    with open(os.path.join(root, 'menu.json')) as f:
+        menu_spec = json.load(f)
+
+    calls = []
+    settings = {"display": {"rotation": 0}}
+    mc = MenuController(menu_spec, settings, lambda s: None, restart_cb=lambda: calls.append(1))
+
+    mc.on_event("DOWN")
+    mc.on_event("DOWN")   # focus Settings on home screen
+    mc.on_event("SELECT") # enter Settings
+    mc.on_event("DOWN")   # Screen Brightness (live)
+    mc.on_event("SELECT")
+    assert calls == []
+
+    mc.on_event("DOWN")   # Rotation (restart required)
+    mc.on_event("SELECT")
+    assert calls == [1]
+    assert settings["system"]["restart_required"] is True
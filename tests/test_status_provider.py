@@ -1,3 +1,4 @@
+from app import status
 from app.status import StatusProvider
 
 
@@ -7,3 +8,50 @@ def test_footer_contains_ip_and_port(monkeypatch):
     monkeypatch.setattr(sp, "_get_local_ip", lambda: "10.0.0.5")
     snap = sp.snapshot()
     assert snap["footer"] == "http://10.0.0.5:1234"
+
+
+def test_read_wifi_uses_proc_net_wireless(monkeypatch, tmp_path):
+    proc = tmp_path / "wireless"
+    proc.write_text(
+        "Inter-| sta-|   Quality        |   Discarded packets\n"
+        " face | tus | link level noise |  nwid  crypt   frag\n"
+        " wlan0: 0000   57.  -53.  -256        0      0      0\n"
+    )
+    monkeypatch.setattr(status, "PROC_NET_WIRELESS", str(proc))
+    monkeypatch.setattr(status, "_ioctl_essid", lambda iface: f"net-{iface}")
+    sp = StatusProvider({"system": {}})
+    monkeypatch.setattr(sp, "_read_wifi_subprocess", lambda: (False, "forked"))
+
+    assert sp._read_wifi() == (True, "net-wlan0")
+
+
+def test_read_wifi_subprocess_parses_iwconfig(monkeypatch):
+    out = (
+        b'eth0      no wireless extensions.\n\n'
+        b'wlan1     IEEE 802.11  ESSID:off/any\n\n'
+        b'wlan0     IEEE 802.11  ESSID:"Home Net"  \n'
+        b'          Mode:Managed  Frequency:2.437 GHz\n'
+    )
+
+    def check_output(cmd, stderr=None):
+        if cmd[0] == "nmcli":
+            raise FileNotFoundError
+        return out
+
+    monkeypatch.setattr(status.subprocess, "check_output", check_output)
+    sp = StatusProvider({"system": {}})
+
+    assert sp._read_wifi_subprocess() == (True, "Home Net")
+
+
+def test_snapshot_is_reused_until_status_changes(monkeypatch):
+    sp = StatusProvider({"system": {}})
+    monkeypatch.setattr(sp, "_read_wifi", lambda: (True, "net"))
+
+    first = sp.snapshot()
+    assert sp.snapshot() is first
+
+    sp.set_restart_required()
+    second = sp.snapshot()
+    assert second is not first
+    assert [icon for icon, _color in second["wifi"]] == ["📶", "↻"]
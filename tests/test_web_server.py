@@ -0,0 +1,265 @@
+import asyncio
+import gzip
+import http.client
+import json
+import struct
+import threading
+
+import numpy as np
+import pytest
+
+from app import web_server
+from app.animation_controller import AnimationControllerThread
+
+
+class DummyLED:
+    def send_raw_frame(self, payload, brightness=None):
+        pass
+
+
+@pytest.fixture
+def server():
+    anim = AnimationControllerThread(
+        stop_evt=threading.Event(), led_thread=DummyLED(), width=4, height=3
+    )
+    srv = web_server.WebServerThread(threading.Event(), anim, host="127.0.0.1", port=0)
+    t = threading.Thread(target=srv.httpd.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.httpd.shutdown()
+    srv.httpd.server_close()
+    srv.loop.close()
+
+
+def get(srv, path, **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.httpd.server_address[1], timeout=5)
+    try:
+        conn.request("GET", path, headers=headers)
+        resp = conn.getresponse()
+        return resp.status, resp.headers, resp.read()
+    finally:
+        conn.close()
+
+
+def test_home_page_is_gzipped_when_accepted(server):
+    status, headers, body = get(server, "/", **{"Accept-Encoding": "gzip, deflate"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == web_server.HOME_PAGE.encode("utf-8")
+
+    status, headers, body = get(server, "/")
+    assert headers.get("Content-Encoding") is None
+    assert body == web_server.HOME_PAGE.encode("utf-8")
+
+
+def test_snapshot_message_prefers_last_broadcast_frame(server):
+    server.anim_thread.update_pixel(0, 0, (1, 2, 3))
+    msg = server._snapshot_message()
+    assert msg[:9] == struct.pack("<BHHI", web_server.MSG_RAW, 4, 3, 12)
+    assert msg[9:] == bytes([1, 2, 3]) + bytes(33)
+
+    server._last_buf, server._last_w, server._last_h = bytes(36), 4, 3
+    assert server._snapshot_message()[9:] == bytes(36)
+
+
+def test_broadcast_drops_clients_whose_send_fails(server):
+    class Client:
+        def __init__(self, fail=False):
+            self.fail, self.sent = fail, []
+
+        async def send(self, msg):
+            if self.fail:
+                raise ConnectionError
+            self.sent.append(msg)
+
+    ok, bad = Client(), Client(fail=True)
+    server.clients.update({ok, bad})
+
+    asyncio.run(server._broadcast(b"frame"))
+
+    assert ok.sent == [b"frame"]
+    assert server.clients == {ok}
+
+
+def test_home_page_revalidates_with_etag(server):
+    _status, headers, _body = get(server, "/")
+    etag = headers["ETag"]
+
+    status, headers, body = get(server, "/", **{"If-None-Match": etag})
+    assert status == 304
+    assert body == b""
+
+
+def test_encode_frame_sends_rle_first_then_deltas(server):
+    buf = bytes([1, 1, 1] * 3 + [2, 2, 2]) + bytes([5, 0, 0] * 4)
+    msg, is_delta = server._encode_frame(buf, 4, 2)
+    assert not is_delta
+    assert msg == struct.pack("<BHHI", web_server.MSG_RLE, 4, 2, 3) + bytes(
+        [3, 1, 1, 1, 1, 2, 2, 2, 4, 5, 0, 0]
+    )
+
+    buf = bytes([1, 1, 1] * 3 + [2, 2, 2]) + bytes([5, 0, 0, 7, 8, 9] + [5, 0, 0] * 2)
+    msg, is_delta = server._encode_frame(buf, 4, 2)
+    assert is_delta
+    assert msg == struct.pack("<BHHI", web_server.MSG_DELTA, 4, 2, 1) + bytes([5, 0, 7, 8, 9])
+
+
+def test_encode_rle_splits_runs_longer_than_255(server):
+    px = np.zeros((300, 3), dtype=np.uint8)
+    counts, starts = server._encode_rle(server._pack(px), 300)
+
+    assert counts.tolist() == [255, 45]
+    assert starts.tolist() == [0, 255]
+
+
+def test_broadcast_loop_coalesces_a_burst_into_one_message(server):
+    class Client:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, msg):
+            self.sent.append(msg)
+
+    async def scenario():
+        server.loop = asyncio.get_running_loop()
+        client = Client()
+        server.clients.add(client)
+        server.anim_thread.add_frame_listener(server._on_frame)
+        task = asyncio.create_task(server._broadcast_loop())
+        for x in range(4):
+            server.anim_thread.update_pixel(x, 0, (9, 9, 9))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        return client.sent
+
+    sent = asyncio.run(scenario())
+
+    assert len(sent) == 1
+    assert sent[0][0] == web_server.MSG_RLE
+
+
+def test_routes_ignore_query_string_and_trailing_slash(server):
+    status, headers, _body = get(server, "/start/?from=menu")
+    assert status == 303
+    assert headers["Location"] == "/"
+    assert server.anim_thread.mode == "test"
+
+    assert get(server, "/draw_mode")[0] == 204
+    assert server.anim_thread.mode == "draw"
+    assert get(server, "/missing")[0] == 404
+
+
+def test_draw_page_is_rendered_once_per_size(server):
+    _status, _headers, body = get(server, "/draw")
+    assert b"const LED_W = 4;" in body and b"const LED_H = 3;" in body
+
+    get(server, "/draw", **{"Accept-Encoding": "gzip"})
+    assert list(server.httpd.draw_cache) == [(4, 3)]
+
+
+def test_broadcast_loop_skips_unchanged_frames(server):
+    class Client:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, msg):
+            self.sent.append(msg)
+
+    async def scenario():
+        server.loop = asyncio.get_running_loop()
+        server._last_buf, server._last_w, server._last_h = server.anim_thread.framebuffer_rgb_bytes()
+        client = Client()
+        server.clients.add(client)
+        server.anim_thread.add_frame_listener(server._on_frame)
+        task = asyncio.create_task(server._broadcast_loop())
+        server.anim_thread.update_pixel(0, 0, (0, 0, 0))  # already black
+        await asyncio.sleep(0.2)
+        task.cancel()
+        return client.sent
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_backed_up_client_skips_deltas_then_gets_a_full_frame(server):
+    class Transport:
+        backlog = 10**6
+
+        def get_write_buffer_size(self):
+            return self.backlog
+
+    class Client:
+        def __init__(self):
+            self.sent, self.transport = [], Transport()
+
+        async def send(self, msg):
+            self.sent.append(msg)
+
+    slow = Client()
+    server.clients.add(slow)
+
+    asyncio.run(server._broadcast(b"delta-1", b"full-1"))
+    assert slow.sent == [] and slow in server._stale
+
+    slow.transport.backlog = 0
+    asyncio.run(server._broadcast(b"delta-2", b"full-2"))
+    asyncio.run(server._broadcast(b"delta-3", b"full-3"))
+    assert slow.sent == [b"full-2", b"delta-3"]
+
+
+def test_connection_is_reused_across_requests(server):
+    conn = http.client.HTTPConnection("127.0.0.1", server.httpd.server_address[1], timeout=5)
+    try:
+        for path, expected in (("/", 200), ("/stop", 303), ("/favicon.ico", 204), ("/draw", 200)):
+            conn.request("GET", path)
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == expected
+            assert resp.version == 11 and not resp.will_close
+    finally:
+        conn.close()
+
+
+def test_snapshot_follows_changes_made_while_nobody_watches(server):
+    async def scenario():
+        server.loop = asyncio.get_running_loop()
+        server.anim_thread.update_pixel(0, 0, (9, 9, 9))
+        server._last_buf, server._last_w, server._last_h = server.anim_thread.framebuffer_rgb_bytes()
+        server.anim_thread.add_frame_listener(server._on_frame)
+        task = asyncio.create_task(server._broadcast_loop())
+        server.anim_thread.clear_panel()  # e.g. /stop with no viewers open
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+    asyncio.run(scenario())
+
+    assert server._snapshot_message()[9:] == bytes(36)
+
+
+def test_malformed_points_do_not_drop_the_rest_of_the_batch(server):
+    class Socket:
+        def __init__(self, messages):
+            self.messages, self.sent = messages, []
+
+        async def send(self, msg):
+            self.sent.append(msg)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if not self.messages:
+                raise StopAsyncIteration
+            return self.messages.pop(0)
+
+    pts = [
+        {"x": 0, "y": 0, "r": 1, "g": 2, "b": 3},
+        {"x": 1, "y": 0, "r": 9},                      # missing keys
+        {"x": "left", "y": 0, "r": 9, "g": 9, "b": 9},  # not a number
+        {"x": 3, "y": 2, "r": 4, "g": 5, "b": 6},
+    ]
+    asyncio.run(server._ws_handler(Socket([json.dumps({"type": "points", "pts": pts})]), "/"))
+
+    buf, _w, _h = server.anim_thread.framebuffer_rgb_bytes()
+    assert buf[:6] == bytes([1, 2, 3, 0, 0, 0])
+    assert buf[-3:] == bytes([4, 5, 6])
+    assert sum(buf) == 21